@@ -2,22 +2,13 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import cache, lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
-import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.helpers.selector import (
-    EntitySelector,
-    EntitySelectorConfig,
-    NumberSelector,
-    NumberSelectorConfig,
-    NumberSelectorMode,
-    SelectSelector,
-    SelectSelectorConfig,
-    TextSelector,
-    TextSelectorConfig,
-)
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import slugify
 
 from .const import (
@@ -76,38 +67,13 @@ from .const import (
     CONF_TYPE,
     CONF_UPDATE_INTERVAL,
     DEFAULT_AC_MISSING_OUTDOOR_POLICY,
-    DEFAULT_AFTER_REACH_DUMB,
-    DEFAULT_AFTER_REACH_SMART,
     DEFAULT_AGGREGATION,
-    DEFAULT_COOL_BIG,
-    DEFAULT_COOL_CATEGORY2_DIFF,
-    DEFAULT_COOL_CATEGORY3_DIFF,
-    DEFAULT_COOL_MEDIUM,
-    DEFAULT_COOL_OUTDOOR_TARGET_DELTA,
-    DEFAULT_COOL_SMALL,
-    DEFAULT_DIRECTION_SWITCH_HYSTERESIS,
     DEFAULT_GLOBAL_TARGET,
     DEFAULT_GLOBAL_TOLERANCE,
-    DEFAULT_HEAT_BIG,
-    DEFAULT_HEAT_CATEGORY2_DIFF,
-    DEFAULT_HEAT_CATEGORY3_DIFF,
-    DEFAULT_HEAT_MEDIUM,
-    DEFAULT_HEAT_ONLY_SHARED_HOLD_EXTRA,
-    DEFAULT_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW,
-    DEFAULT_HEAT_OUTDOOR_TARGET_DELTA,
-    DEFAULT_HEAT_SMALL,
-    DEFAULT_HOLD_OFFSET_DECAY_STEP,
-    DEFAULT_MAX_OFFSET,
-    DEFAULT_MIN_ACTION_INTERVAL,
     DEFAULT_MODE,
-    DEFAULT_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
-    DEFAULT_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
-    DEFAULT_STEP_OFFSET,
-    DEFAULT_T_TIME,
-    DEFAULT_TOLERANCE,
     DEFAULT_TYPE,
-    DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    OPTIONS_DEFAULTS,
     OUTDOOR_POLICY_ALLOW,
     OUTDOOR_POLICY_BLOCK,
     OUTDOOR_SOURCE_NONE,
@@ -116,6 +82,413 @@ from .const import (
 )
 from .dumb import parse_dumb_devices_json
 
+if TYPE_CHECKING:
+    import voluptuous as vol
+    from homeassistant.helpers.selector import (
+        EntitySelector,
+        NumberSelector,
+        SelectSelector,
+        TextSelector,
+    )
+
+# Static dropdown choices; SelectSelector validates ``options`` as a list.
+_OUTDOOR_SOURCE_OPTIONS = [
+    {"value": OUTDOOR_SOURCE_NONE, "label": "No source"},
+    {"value": OUTDOOR_SOURCE_WEATHER, "label": "Weather entity"},
+    {"value": OUTDOOR_SOURCE_SENSOR, "label": "Temperature sensor"},
+]
+_OUTDOOR_POLICY_OPTIONS = [
+    {"value": OUTDOOR_POLICY_BLOCK, "label": "Block weather-sensitive devices"},
+    {"value": OUTDOOR_POLICY_ALLOW, "label": "Allow weather-sensitive devices"},
+]
+_AGGREGATION_OPTIONS = [
+    {"value": "average", "label": "Average"},
+    {"value": "min", "label": "Minimum"},
+    {"value": "max", "label": "Maximum"},
+    {"value": "median", "label": "Median"},
+    {"value": "first", "label": "First sensor"},
+]
+_AFTER_REACH_OPTIONS = [
+    {"value": "keep_on", "label": "Keep on"},
+    {"value": "set_target", "label": "Set target"},
+    {"value": "turn_off", "label": "Turn off"},
+]
+_SHARED_ARBITRATION_OPTIONS = [
+    {"value": "max_demand", "label": "Max demand wins"},
+    {"value": "priority_room", "label": "Priority room"},
+    {"value": "average_request", "label": "Average request"},
+]
+
+# Entity-list fields of the room forms, in stored order.
+_ROOM_LIST_KEYS = (
+    CONF_ROOM_TEMP_SENSORS,
+    CONF_ROOM_HEAT_CATEGORY_1,
+    CONF_ROOM_HEAT_CATEGORY_2,
+    CONF_ROOM_HEAT_CATEGORY_3,
+    CONF_ROOM_COOL_CATEGORY_1,
+    CONF_ROOM_COOL_CATEGORY_2,
+    CONF_ROOM_COOL_CATEGORY_3,
+    CONF_ROOM_WEATHER_SENSITIVE_CLIMATES,
+    CONF_ROOM_SHARED_CLIMATES,
+    CONF_ROOM_HEAT_ONLY_CLIMATES,
+)
+
+# Dropdown choice lists by name, shared by the cached selectors below.
+_DROPDOWN_OPTIONS: dict[str, list[dict[str, str]]] = {
+    "outdoor_source": _OUTDOOR_SOURCE_OPTIONS,
+    "outdoor_policy": _OUTDOOR_POLICY_OPTIONS,
+    "aggregation": _AGGREGATION_OPTIONS,
+    "after_reach": _AFTER_REACH_OPTIONS,
+    "shared_arbitration": _SHARED_ARBITRATION_OPTIONS,
+}
+
+# Required settings-step fields and the cast applied on submit (None keeps the value).
+_SETTINGS_FIELDS: tuple[tuple[str, Callable[[Any], Any] | None], ...] = (
+    (CONF_TOLERANCE, None),
+    (CONF_DIRECTION_SWITCH_HYSTERESIS, None),
+    (CONF_T_TIME, int),
+    (CONF_UPDATE_INTERVAL, int),
+    (CONF_MAX_OFFSET, None),
+    (CONF_STEP_OFFSET, None),
+    (CONF_HOLD_OFFSET_DECAY_STEP, None),
+    (CONF_MIN_ACTION_INTERVAL, int),
+    (CONF_HEAT_SMALL, None),
+    (CONF_HEAT_MEDIUM, None),
+    (CONF_HEAT_BIG, None),
+    (CONF_HEAT_CATEGORY2_DIFF, None),
+    (CONF_HEAT_CATEGORY3_DIFF, None),
+    (CONF_COOL_SMALL, None),
+    (CONF_COOL_MEDIUM, None),
+    (CONF_COOL_BIG, None),
+    (CONF_COOL_CATEGORY2_DIFF, None),
+    (CONF_COOL_CATEGORY3_DIFF, None),
+    (CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE, float),
+    (CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE, float),
+    (CONF_COOL_OUTDOOR_TARGET_DELTA, None),
+    (CONF_HEAT_OUTDOOR_TARGET_DELTA, None),
+    (CONF_HEAT_ONLY_SHARED_HOLD_EXTRA, None),
+    (CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW, None),
+    (CONF_AFTER_REACH_SMART, None),
+    (CONF_AFTER_REACH_DUMB, None),
+    (CONF_SHARED_ARBITRATION, None),
+)
+_SETTINGS_DEFAULTS: dict[str, Any] = {**OPTIONS_DEFAULTS, CONF_PRIORITY_ROOM: ""}
+_settings_values = itemgetter(*(key for key, _ in _SETTINGS_FIELDS))
+# Options rendered by the settings step; their values key the cached schema.
+_SETTINGS_KEYS = (*(key for key, _ in _SETTINGS_FIELDS), CONF_PRIORITY_ROOM)
+
+
+@cache
+def _dropdown_selector(choices: str) -> SelectSelector:
+    """Return the shared dropdown selector for the named choice list."""
+    from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
+
+    return SelectSelector(SelectSelectorConfig(options=_DROPDOWN_OPTIONS[choices], mode="dropdown"))
+
+
+@cache
+def _entity_selector(domain: str) -> EntitySelector:
+    """Return a shared single-entity selector for ``domain``."""
+    from homeassistant.helpers.selector import EntitySelector, EntitySelectorConfig
+
+    return EntitySelector(EntitySelectorConfig(domain=domain, multiple=False))
+
+
+@cache
+def _entity_list_selector(domain: str) -> EntitySelector:
+    """Return a shared multi-entity selector for ``domain``."""
+    from homeassistant.helpers.selector import EntitySelector, EntitySelectorConfig
+
+    return EntitySelector(EntitySelectorConfig(domain=domain, multiple=True))
+
+
+@cache
+def _text_selector(multiline: bool = False) -> TextSelector:
+    """Return a shared text selector."""
+    from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
+
+    return TextSelector(TextSelectorConfig(multiline=multiline))
+
+
+@cache
+def _number_selector(minimum: float, maximum: float, step: float) -> NumberSelector:
+    """Return a shared box-mode number selector for the given bounds."""
+    from homeassistant.helpers.selector import (
+        NumberSelector,
+        NumberSelectorConfig,
+        NumberSelectorMode,
+    )
+
+    return NumberSelector(
+        NumberSelectorConfig(min=minimum, max=maximum, step=step, mode=NumberSelectorMode.BOX)
+    )
+
+
+@cache
+def _user_schema() -> vol.Schema:
+    """Build the schema of the initial global configuration step."""
+    import voluptuous as vol
+
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_OUTDOOR_SOURCE_TYPE, default=OUTDOOR_SOURCE_NONE
+            ): _dropdown_selector("outdoor_source"),
+            vol.Optional(CONF_OUTDOOR_WEATHER): _entity_selector("weather"),
+            vol.Optional(CONF_OUTDOOR_SENSOR): _entity_selector("sensor"),
+            vol.Required(
+                CONF_AC_MISSING_OUTDOOR_POLICY,
+                default=DEFAULT_AC_MISSING_OUTDOOR_POLICY,
+            ): _dropdown_selector("outdoor_policy"),
+            vol.Required(CONF_AGGREGATION, default=DEFAULT_AGGREGATION): _dropdown_selector("aggregation"),
+        }
+    )
+
+
+@cache
+def _new_room_schema() -> vol.Schema:
+    """Build the schema of the room step used during initial setup."""
+    import voluptuous as vol
+
+    return vol.Schema(
+        {
+            vol.Required(CONF_ROOM_NAME): _text_selector(),
+            vol.Required(CONF_ROOM_TEMP_SENSORS): _entity_list_selector("sensor"),
+            vol.Optional(CONF_ROOM_HEAT_CATEGORY_1, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_HEAT_CATEGORY_2, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_HEAT_CATEGORY_3, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_COOL_CATEGORY_1, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_COOL_CATEGORY_2, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_COOL_CATEGORY_3, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_WEATHER_SENSITIVE_CLIMATES, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_SHARED_CLIMATES, default=[]): _entity_list_selector("climate"),
+            vol.Optional(CONF_ROOM_HEAT_ONLY_CLIMATES, default=[]): _entity_list_selector("climate"),
+            vol.Optional("dumb_devices_json", default=""): _text_selector(multiline=True),
+            vol.Required("add_another_room", default=False): bool,
+        }
+    )
+
+
+def _settings_schema(options: Mapping[str, Any]) -> vol.Schema:
+    """Return the settings schema with defaults taken from current options."""
+    return _build_settings_schema(
+        tuple((key, options[key]) for key in _SETTINGS_KEYS if key in options)
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_settings_schema(items: tuple[tuple[str, Any], ...]) -> vol.Schema:
+    """Build the settings schema for one snapshot of the settings options."""
+    import voluptuous as vol
+
+    defaults = _SETTINGS_DEFAULTS | dict(items)
+    return vol.Schema(
+        {
+            vol.Required(CONF_TOLERANCE, default=defaults[CONF_TOLERANCE]): _number_selector(0.1, 5, 0.1),
+            vol.Required(
+                CONF_DIRECTION_SWITCH_HYSTERESIS,
+                default=defaults[CONF_DIRECTION_SWITCH_HYSTERESIS],
+            ): _number_selector(0.0, 5, 0.1),
+            vol.Required(CONF_T_TIME, default=defaults[CONF_T_TIME]): _number_selector(30, 3600, 10),
+            vol.Required(
+                CONF_UPDATE_INTERVAL, default=defaults[CONF_UPDATE_INTERVAL]
+            ): _number_selector(10, 600, 5),
+            vol.Required(CONF_MAX_OFFSET, default=defaults[CONF_MAX_OFFSET]): _number_selector(0.1, 10, 0.1),
+            vol.Required(CONF_STEP_OFFSET, default=defaults[CONF_STEP_OFFSET]): _number_selector(0.1, 5, 0.1),
+            vol.Required(
+                CONF_HOLD_OFFSET_DECAY_STEP,
+                default=defaults[CONF_HOLD_OFFSET_DECAY_STEP],
+            ): _number_selector(0.1, 5, 0.1),
+            vol.Required(
+                CONF_MIN_ACTION_INTERVAL,
+                default=defaults[CONF_MIN_ACTION_INTERVAL],
+            ): _number_selector(5, 600, 5),
+            vol.Required(CONF_HEAT_SMALL, default=defaults[CONF_HEAT_SMALL]): _number_selector(0.1, 10, 0.1),
+            vol.Required(
+                CONF_HEAT_MEDIUM, default=defaults[CONF_HEAT_MEDIUM]
+            ): _number_selector(0.1, 15, 0.1),
+            vol.Required(CONF_HEAT_BIG, default=defaults[CONF_HEAT_BIG]): _number_selector(0.1, 20, 0.1),
+            vol.Required(
+                CONF_HEAT_CATEGORY2_DIFF,
+                default=defaults[CONF_HEAT_CATEGORY2_DIFF],
+            ): _number_selector(0.1, 15, 0.1),
+            vol.Required(
+                CONF_HEAT_CATEGORY3_DIFF,
+                default=defaults[CONF_HEAT_CATEGORY3_DIFF],
+            ): _number_selector(0.1, 20, 0.1),
+            vol.Required(CONF_COOL_SMALL, default=defaults[CONF_COOL_SMALL]): _number_selector(0.1, 10, 0.1),
+            vol.Required(
+                CONF_COOL_MEDIUM, default=defaults[CONF_COOL_MEDIUM]
+            ): _number_selector(0.1, 15, 0.1),
+            vol.Required(CONF_COOL_BIG, default=defaults[CONF_COOL_BIG]): _number_selector(0.1, 20, 0.1),
+            vol.Required(
+                CONF_COOL_CATEGORY2_DIFF,
+                default=defaults[CONF_COOL_CATEGORY2_DIFF],
+            ): _number_selector(0.1, 15, 0.1),
+            vol.Required(
+                CONF_COOL_CATEGORY3_DIFF,
+                default=defaults[CONF_COOL_CATEGORY3_DIFF],
+            ): _number_selector(0.1, 20, 0.1),
+            vol.Required(
+                CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
+                default=defaults[CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE],
+            ): _number_selector(-40, 60, 0.5),
+            vol.Required(
+                CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
+                default=defaults[CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE],
+            ): _number_selector(-40, 60, 0.5),
+            vol.Required(
+                CONF_COOL_OUTDOOR_TARGET_DELTA,
+                default=defaults[CONF_COOL_OUTDOOR_TARGET_DELTA],
+            ): _number_selector(0.0, 20, 0.1),
+            vol.Required(
+                CONF_HEAT_OUTDOOR_TARGET_DELTA,
+                default=defaults[CONF_HEAT_OUTDOOR_TARGET_DELTA],
+            ): _number_selector(0.0, 20, 0.1),
+            vol.Required(
+                CONF_HEAT_ONLY_SHARED_HOLD_EXTRA,
+                default=defaults[CONF_HEAT_ONLY_SHARED_HOLD_EXTRA],
+            ): _number_selector(0.0, 20, 0.1),
+            vol.Required(
+                CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW,
+                default=defaults[CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW],
+            ): _number_selector(-40, 40, 0.5),
+            vol.Required(
+                CONF_AFTER_REACH_SMART,
+                default=defaults[CONF_AFTER_REACH_SMART],
+            ): _dropdown_selector("after_reach"),
+            vol.Required(
+                CONF_AFTER_REACH_DUMB,
+                default=defaults[CONF_AFTER_REACH_DUMB],
+            ): _dropdown_selector("after_reach"),
+            vol.Required(
+                CONF_SHARED_ARBITRATION, default=defaults[CONF_SHARED_ARBITRATION]
+            ): _dropdown_selector("shared_arbitration"),
+            vol.Optional(CONF_PRIORITY_ROOM, default=defaults[CONF_PRIORITY_ROOM]): _text_selector(),
+        }
+    )
+
+
+def _dumb_devices_default(devices: list[dict[str, Any]] | None) -> str:
+    """Render the dumb-device JSON prefill; empty lists leave the field blank."""
+    if not devices:
+        return ""
+    return json_dumps(devices)
+
+
+def _room_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
+    """Return the room schema of the options flow, prefilled from ``defaults``."""
+    if not defaults:
+        return _blank_room_schema()
+    return _build_room_schema(defaults)
+
+
+@cache
+def _blank_room_schema() -> vol.Schema:
+    """Build the empty room schema shown when adding a room."""
+    return _build_room_schema({})
+
+
+def _build_room_schema(room: Mapping[str, Any]) -> vol.Schema:
+    """Build the room schema of the options flow for one room's values."""
+    import voluptuous as vol
+
+    return vol.Schema(
+        {
+            vol.Required(CONF_ROOM_NAME, default=room.get(CONF_ROOM_NAME, "")): _text_selector(),
+            vol.Required(
+                CONF_ROOM_TEMP_SENSORS,
+                default=room.get(CONF_ROOM_TEMP_SENSORS, []),
+            ): _entity_list_selector("sensor"),
+            vol.Optional(
+                CONF_ROOM_HEAT_CATEGORY_1,
+                default=room.get(CONF_ROOM_HEAT_CATEGORY_1, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_HEAT_CATEGORY_2,
+                default=room.get(CONF_ROOM_HEAT_CATEGORY_2, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_HEAT_CATEGORY_3,
+                default=room.get(CONF_ROOM_HEAT_CATEGORY_3, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_COOL_CATEGORY_1,
+                default=room.get(CONF_ROOM_COOL_CATEGORY_1, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_COOL_CATEGORY_2,
+                default=room.get(CONF_ROOM_COOL_CATEGORY_2, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_COOL_CATEGORY_3,
+                default=room.get(CONF_ROOM_COOL_CATEGORY_3, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_WEATHER_SENSITIVE_CLIMATES,
+                default=room.get(CONF_ROOM_WEATHER_SENSITIVE_CLIMATES, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_SHARED_CLIMATES,
+                default=room.get(CONF_ROOM_SHARED_CLIMATES, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                CONF_ROOM_HEAT_ONLY_CLIMATES,
+                default=room.get(CONF_ROOM_HEAT_ONLY_CLIMATES, []),
+            ): _entity_list_selector("climate"),
+            vol.Optional(
+                "dumb_devices_json",
+                default=_dumb_devices_default(room.get(CONF_ROOM_DUMB_DEVICES)),
+            ): _text_selector(multiline=True),
+        }
+    )
+
+
+def _room_select_schema(rooms: Sequence[Mapping[str, Any]]) -> vol.Schema:
+    """Build the schema for picking one of the configured rooms."""
+    import voluptuous as vol
+    from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
+
+    return vol.Schema(
+        {
+            vol.Required("room_id"): SelectSelector(
+                SelectSelectorConfig(
+                    options=[{"value": room[CONF_ROOM_ID], "label": room[CONF_ROOM_NAME]} for room in rooms],
+                    mode="dropdown",
+                )
+            )
+        }
+    )
+
+
+@cache
+def _delete_confirm_schema() -> vol.Schema:
+    """Build the schema of the room deletion confirmation step."""
+    import voluptuous as vol
+
+    return vol.Schema(
+        {
+            vol.Required("confirm_delete", default=False): bool,
+        }
+    )
+
+
+def _build_room_payload(user_input: Mapping[str, Any], room_id: str) -> dict[str, Any]:
+    """Build the stored room dict from a submitted room form."""
+    room: dict[str, Any] = {
+        CONF_ROOM_ID: room_id,
+        CONF_ROOM_NAME: user_input[CONF_ROOM_NAME],
+    }
+    for key in _ROOM_LIST_KEYS:
+        room[key] = user_input.get(key, [])
+    room[CONF_ROOM_DUMB_DEVICES] = parse_dumb_devices_json(user_input.get("dumb_devices_json", ""))
+    return room
+
+
+def _room_id_set(rooms: Iterable[Mapping[str, Any]]) -> set[str]:
+    """Return the ids of ``rooms`` for membership checks."""
+    return {room[CONF_ROOM_ID] for room in rooms}
+
 
 class SmartClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Smart Climate."""
@@ -125,6 +498,7 @@ class SmartClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         self._config: dict[str, Any] = {}
         self._rooms: list[dict[str, Any]] = []
+        self._room_ids: set[str] = set()
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Initial step with global configuration."""
@@ -142,86 +516,28 @@ class SmartClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
             return await self.async_step_room()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_OUTDOOR_SOURCE_TYPE, default=OUTDOOR_SOURCE_NONE): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": OUTDOOR_SOURCE_NONE, "label": "No source"},
-                            {"value": OUTDOOR_SOURCE_WEATHER, "label": "Weather entity"},
-                            {"value": OUTDOOR_SOURCE_SENSOR, "label": "Temperature sensor"},
-                        ],
-                        mode="dropdown",
-                    )
-                ),
-                vol.Optional(CONF_OUTDOOR_WEATHER): EntitySelector(
-                    EntitySelectorConfig(domain="weather", multiple=False)
-                ),
-                vol.Optional(CONF_OUTDOOR_SENSOR): EntitySelector(
-                    EntitySelectorConfig(domain="sensor", multiple=False)
-                ),
-                vol.Required(
-                    CONF_AC_MISSING_OUTDOOR_POLICY,
-                    default=DEFAULT_AC_MISSING_OUTDOOR_POLICY,
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": OUTDOOR_POLICY_BLOCK, "label": "Block weather-sensitive devices"},
-                            {"value": OUTDOOR_POLICY_ALLOW, "label": "Allow weather-sensitive devices"},
-                        ],
-                        mode="dropdown",
-                    )
-                ),
-                vol.Required(CONF_AGGREGATION, default=DEFAULT_AGGREGATION): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": "average", "label": "Average"},
-                            {"value": "min", "label": "Minimum"},
-                            {"value": "max", "label": "Maximum"},
-                            {"value": "median", "label": "Median"},
-                            {"value": "first", "label": "First sensor"},
-                        ],
-                        mode="dropdown",
-                    )
-                ),
-            }
-        )
-        return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
+        return self.async_show_form(step_id="user", data_schema=_user_schema(), errors=errors)
 
     async def async_step_room(self, user_input: dict[str, Any] | None = None):
         """Add rooms one by one."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            try:
-                room_id = slugify(user_input[CONF_ROOM_NAME])
-                dumb_devices = parse_dumb_devices_json(user_input.get("dumb_devices_json", ""))
-                room = {
-                    CONF_ROOM_ID: room_id,
-                    CONF_ROOM_NAME: user_input[CONF_ROOM_NAME],
-                    CONF_ROOM_TEMP_SENSORS: user_input.get(CONF_ROOM_TEMP_SENSORS, []),
-                    CONF_ROOM_HEAT_CATEGORY_1: user_input.get(CONF_ROOM_HEAT_CATEGORY_1, []),
-                    CONF_ROOM_HEAT_CATEGORY_2: user_input.get(CONF_ROOM_HEAT_CATEGORY_2, []),
-                    CONF_ROOM_HEAT_CATEGORY_3: user_input.get(CONF_ROOM_HEAT_CATEGORY_3, []),
-                    CONF_ROOM_COOL_CATEGORY_1: user_input.get(CONF_ROOM_COOL_CATEGORY_1, []),
-                    CONF_ROOM_COOL_CATEGORY_2: user_input.get(CONF_ROOM_COOL_CATEGORY_2, []),
-                    CONF_ROOM_COOL_CATEGORY_3: user_input.get(CONF_ROOM_COOL_CATEGORY_3, []),
-                    CONF_ROOM_WEATHER_SENSITIVE_CLIMATES: user_input.get(
-                        CONF_ROOM_WEATHER_SENSITIVE_CLIMATES, []
-                    ),
-                    CONF_ROOM_SHARED_CLIMATES: user_input.get(CONF_ROOM_SHARED_CLIMATES, []),
-                    CONF_ROOM_HEAT_ONLY_CLIMATES: user_input.get(CONF_ROOM_HEAT_ONLY_CLIMATES, []),
-                    CONF_ROOM_DUMB_DEVICES: dumb_devices,
-                }
-                if any(existing[CONF_ROOM_ID] == room_id for existing in self._rooms):
-                    errors[CONF_ROOM_NAME] = "duplicate_room"
+            room_id = slugify(user_input[CONF_ROOM_NAME])
+            if room_id in self._room_ids:
+                errors[CONF_ROOM_NAME] = "duplicate_room"
+            else:
+                try:
+                    room = _build_room_payload(user_input, room_id)
+                except (TypeError, ValueError):
+                    errors["base"] = "invalid_room_json"
                 else:
                     self._rooms.append(room)
+                    self._room_ids.add(room_id)
                     if user_input.get("add_another_room", False):
                         return await self.async_step_room()
 
-                    data = {
-                        **self._config,
+                    data = self._config | {
                         CONF_ROOMS: self._rooms,
                         CONF_MODE: DEFAULT_MODE,
                         CONF_TYPE: DEFAULT_TYPE,
@@ -229,47 +545,8 @@ class SmartClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_GLOBAL_TOLERANCE: DEFAULT_GLOBAL_TOLERANCE,
                     }
                     return self.async_create_entry(title="Умный климат", data=data)
-            except Exception:
-                errors["base"] = "invalid_room_json"
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_ROOM_NAME): TextSelector(TextSelectorConfig()),
-                vol.Required(CONF_ROOM_TEMP_SENSORS): EntitySelector(
-                    EntitySelectorConfig(domain="sensor", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_HEAT_CATEGORY_1, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_HEAT_CATEGORY_2, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_HEAT_CATEGORY_3, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_COOL_CATEGORY_1, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_COOL_CATEGORY_2, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_COOL_CATEGORY_3, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_WEATHER_SENSITIVE_CLIMATES, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_SHARED_CLIMATES, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_HEAT_ONLY_CLIMATES, default=[]): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional("dumb_devices_json", default=""): TextSelector(TextSelectorConfig(multiline=True)),
-                vol.Required("add_another_room", default=False): bool,
-            }
-        )
-        return self.async_show_form(step_id="room", data_schema=data_schema, errors=errors)
+        return self.async_show_form(step_id="room", data_schema=_new_room_schema(), errors=errors)
 
     @staticmethod
     @config_entries.callback
@@ -283,9 +560,10 @@ class SmartClimateOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._entry = config_entry
         self._selected_room_id: str | None = None
+        self._stored_room_ids: set[str] | None = None
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
-        rooms = self._current_rooms()
+        rooms = self._rooms_view()
         menu_options = ["settings", "add_room"]
         if rooms:
             menu_options.extend(["edit_room_select", "delete_room_select"])
@@ -293,393 +571,127 @@ class SmartClimateOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_settings(self, user_input: dict[str, Any] | None = None):
         if user_input is not None:
-            outdoor_min = float(user_input[CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE])
-            outdoor_max = float(user_input[CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE])
-            if outdoor_min > outdoor_max:
-                outdoor_min, outdoor_max = outdoor_max, outdoor_min
             options = dict(self._entry.options)
-            options.update(
-                {
-                    CONF_TOLERANCE: user_input[CONF_TOLERANCE],
-                    CONF_DIRECTION_SWITCH_HYSTERESIS: user_input[CONF_DIRECTION_SWITCH_HYSTERESIS],
-                    CONF_T_TIME: int(user_input[CONF_T_TIME]),
-                    CONF_UPDATE_INTERVAL: int(user_input[CONF_UPDATE_INTERVAL]),
-                    CONF_MAX_OFFSET: user_input[CONF_MAX_OFFSET],
-                    CONF_STEP_OFFSET: user_input[CONF_STEP_OFFSET],
-                    CONF_HOLD_OFFSET_DECAY_STEP: user_input[CONF_HOLD_OFFSET_DECAY_STEP],
-                    CONF_MIN_ACTION_INTERVAL: int(user_input[CONF_MIN_ACTION_INTERVAL]),
-                    CONF_HEAT_SMALL: user_input[CONF_HEAT_SMALL],
-                    CONF_HEAT_MEDIUM: user_input[CONF_HEAT_MEDIUM],
-                    CONF_HEAT_BIG: user_input[CONF_HEAT_BIG],
-                    CONF_HEAT_CATEGORY2_DIFF: user_input[CONF_HEAT_CATEGORY2_DIFF],
-                    CONF_HEAT_CATEGORY3_DIFF: user_input[CONF_HEAT_CATEGORY3_DIFF],
-                    CONF_COOL_SMALL: user_input[CONF_COOL_SMALL],
-                    CONF_COOL_MEDIUM: user_input[CONF_COOL_MEDIUM],
-                    CONF_COOL_BIG: user_input[CONF_COOL_BIG],
-                    CONF_COOL_CATEGORY2_DIFF: user_input[CONF_COOL_CATEGORY2_DIFF],
-                    CONF_COOL_CATEGORY3_DIFF: user_input[CONF_COOL_CATEGORY3_DIFF],
-                    CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE: outdoor_min,
-                    CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE: outdoor_max,
-                    CONF_COOL_OUTDOOR_TARGET_DELTA: user_input[CONF_COOL_OUTDOOR_TARGET_DELTA],
-                    CONF_HEAT_OUTDOOR_TARGET_DELTA: user_input[CONF_HEAT_OUTDOOR_TARGET_DELTA],
-                    CONF_HEAT_ONLY_SHARED_HOLD_EXTRA: user_input[CONF_HEAT_ONLY_SHARED_HOLD_EXTRA],
-                    CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW: user_input[
-                        CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW
-                    ],
-                    CONF_AFTER_REACH_SMART: user_input[CONF_AFTER_REACH_SMART],
-                    CONF_AFTER_REACH_DUMB: user_input[CONF_AFTER_REACH_DUMB],
-                    CONF_SHARED_ARBITRATION: user_input[CONF_SHARED_ARBITRATION],
-                    CONF_PRIORITY_ROOM: user_input.get(CONF_PRIORITY_ROOM, ""),
-                }
-            )
-            self._sanitize_room_dependent_options(options, set(self._room_ids()))
+            for (key, cast), value in zip(
+                _SETTINGS_FIELDS, _settings_values(user_input), strict=True
+            ):
+                options[key] = value if cast is None else cast(value)
+            options[CONF_PRIORITY_ROOM] = user_input.get(CONF_PRIORITY_ROOM, "")
+            outdoor_min = options[CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE]
+            outdoor_max = options[CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE]
+            if outdoor_min > outdoor_max:
+                options[CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE] = outdoor_max
+                options[CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE] = outdoor_min
+            self._sanitize_room_dependent_options(options, self._room_ids())
             return self.async_create_entry(title="", data=options)
 
-        options = self._entry.options
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_TOLERANCE, default=options.get(CONF_TOLERANCE, DEFAULT_TOLERANCE)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=5, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_DIRECTION_SWITCH_HYSTERESIS,
-                    default=options.get(
-                        CONF_DIRECTION_SWITCH_HYSTERESIS,
-                        DEFAULT_DIRECTION_SWITCH_HYSTERESIS,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=0.0, max=5, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(CONF_T_TIME, default=options.get(CONF_T_TIME, DEFAULT_T_TIME)): NumberSelector(
-                    NumberSelectorConfig(min=30, max=3600, step=10, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_UPDATE_INTERVAL, default=options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-                ): NumberSelector(NumberSelectorConfig(min=10, max=600, step=5, mode=NumberSelectorMode.BOX)),
-                vol.Required(CONF_MAX_OFFSET, default=options.get(CONF_MAX_OFFSET, DEFAULT_MAX_OFFSET)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=10, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(CONF_STEP_OFFSET, default=options.get(CONF_STEP_OFFSET, DEFAULT_STEP_OFFSET)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=5, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_HOLD_OFFSET_DECAY_STEP,
-                    default=options.get(CONF_HOLD_OFFSET_DECAY_STEP, DEFAULT_HOLD_OFFSET_DECAY_STEP),
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=5, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_MIN_ACTION_INTERVAL,
-                    default=options.get(CONF_MIN_ACTION_INTERVAL, DEFAULT_MIN_ACTION_INTERVAL),
-                ): NumberSelector(NumberSelectorConfig(min=5, max=600, step=5, mode=NumberSelectorMode.BOX)),
-                vol.Required(CONF_HEAT_SMALL, default=options.get(CONF_HEAT_SMALL, DEFAULT_HEAT_SMALL)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=10, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_HEAT_MEDIUM, default=options.get(CONF_HEAT_MEDIUM, DEFAULT_HEAT_MEDIUM)
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=15, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(CONF_HEAT_BIG, default=options.get(CONF_HEAT_BIG, DEFAULT_HEAT_BIG)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=20, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_HEAT_CATEGORY2_DIFF,
-                    default=options.get(CONF_HEAT_CATEGORY2_DIFF, DEFAULT_HEAT_CATEGORY2_DIFF),
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=15, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_HEAT_CATEGORY3_DIFF,
-                    default=options.get(CONF_HEAT_CATEGORY3_DIFF, DEFAULT_HEAT_CATEGORY3_DIFF),
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=20, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(CONF_COOL_SMALL, default=options.get(CONF_COOL_SMALL, DEFAULT_COOL_SMALL)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=10, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_COOL_MEDIUM, default=options.get(CONF_COOL_MEDIUM, DEFAULT_COOL_MEDIUM)
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=15, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(CONF_COOL_BIG, default=options.get(CONF_COOL_BIG, DEFAULT_COOL_BIG)): NumberSelector(
-                    NumberSelectorConfig(min=0.1, max=20, step=0.1, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Required(
-                    CONF_COOL_CATEGORY2_DIFF,
-                    default=options.get(CONF_COOL_CATEGORY2_DIFF, DEFAULT_COOL_CATEGORY2_DIFF),
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=15, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_COOL_CATEGORY3_DIFF,
-                    default=options.get(CONF_COOL_CATEGORY3_DIFF, DEFAULT_COOL_CATEGORY3_DIFF),
-                ): NumberSelector(NumberSelectorConfig(min=0.1, max=20, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
-                    default=options.get(
-                        CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
-                        DEFAULT_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=-40, max=60, step=0.5, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
-                    default=options.get(
-                        CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
-                        DEFAULT_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=-40, max=60, step=0.5, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_COOL_OUTDOOR_TARGET_DELTA,
-                    default=options.get(
-                        CONF_COOL_OUTDOOR_TARGET_DELTA,
-                        DEFAULT_COOL_OUTDOOR_TARGET_DELTA,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=0.0, max=20, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_HEAT_OUTDOOR_TARGET_DELTA,
-                    default=options.get(
-                        CONF_HEAT_OUTDOOR_TARGET_DELTA,
-                        DEFAULT_HEAT_OUTDOOR_TARGET_DELTA,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=0.0, max=20, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_HEAT_ONLY_SHARED_HOLD_EXTRA,
-                    default=options.get(
-                        CONF_HEAT_ONLY_SHARED_HOLD_EXTRA,
-                        DEFAULT_HEAT_ONLY_SHARED_HOLD_EXTRA,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=0.0, max=20, step=0.1, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW,
-                    default=options.get(
-                        CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW,
-                        DEFAULT_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW,
-                    ),
-                ): NumberSelector(NumberSelectorConfig(min=-40, max=40, step=0.5, mode=NumberSelectorMode.BOX)),
-                vol.Required(
-                    CONF_AFTER_REACH_SMART,
-                    default=options.get(CONF_AFTER_REACH_SMART, DEFAULT_AFTER_REACH_SMART),
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": "keep_on", "label": "Keep on"},
-                            {"value": "set_target", "label": "Set target"},
-                            {"value": "turn_off", "label": "Turn off"},
-                        ],
-                        mode="dropdown",
-                    )
-                ),
-                vol.Required(
-                    CONF_AFTER_REACH_DUMB,
-                    default=options.get(CONF_AFTER_REACH_DUMB, DEFAULT_AFTER_REACH_DUMB),
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": "keep_on", "label": "Keep on"},
-                            {"value": "set_target", "label": "Set target"},
-                            {"value": "turn_off", "label": "Turn off"},
-                        ],
-                        mode="dropdown",
-                    )
-                ),
-                vol.Required(CONF_SHARED_ARBITRATION, default=options.get(CONF_SHARED_ARBITRATION, "max_demand")): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": "max_demand", "label": "Max demand wins"},
-                            {"value": "priority_room", "label": "Priority room"},
-                            {"value": "average_request", "label": "Average request"},
-                        ],
-                        mode="dropdown",
-                    )
-                ),
-                vol.Optional(CONF_PRIORITY_ROOM, default=options.get(CONF_PRIORITY_ROOM, "")): TextSelector(
-                    TextSelectorConfig()
-                ),
-            }
-        )
-
-        return self.async_show_form(step_id="settings", data_schema=schema)
+        return self.async_show_form(step_id="settings", data_schema=_settings_schema(self._entry.options))
 
     async def async_step_add_room(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
-        rooms = self._current_rooms()
+        rooms = self._rooms_view()
         if user_input is not None:
-            try:
-                room_id = slugify(user_input[CONF_ROOM_NAME])
-                if any(existing[CONF_ROOM_ID] == room_id for existing in rooms):
-                    errors[CONF_ROOM_NAME] = "duplicate_room"
+            room_id = slugify(user_input[CONF_ROOM_NAME])
+            if room_id in self._room_ids():
+                errors[CONF_ROOM_NAME] = "duplicate_room"
+            else:
+                try:
+                    room = _build_room_payload(user_input, room_id)
+                except (TypeError, ValueError):
+                    errors["base"] = "invalid_room_json"
                 else:
-                    room = self._build_room_payload(user_input, room_id=room_id)
-                    rooms.append(room)
-                    return self._create_entry_with_rooms(rooms)
-            except Exception:
-                errors["base"] = "invalid_room_json"
+                    return self._create_entry_with_rooms([*rooms, room])
 
         return self.async_show_form(
             step_id="add_room",
-            data_schema=self._room_schema(),
+            data_schema=_room_schema(),
             errors=errors,
         )
 
     async def async_step_edit_room_select(self, user_input: dict[str, Any] | None = None):
-        rooms = self._current_rooms()
+        rooms = self._rooms_view()
         if not rooms:
             return self.async_abort(reason="no_rooms")
 
-        room_ids = {room[CONF_ROOM_ID] for room in rooms}
+        room_ids = self._room_ids()
         if user_input is not None:
             selected = user_input["room_id"]
             if selected in room_ids:
                 self._selected_room_id = selected
                 return await self.async_step_edit_room()
 
-        schema = vol.Schema(
-            {
-                vol.Required("room_id"): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[{"value": room[CONF_ROOM_ID], "label": room[CONF_ROOM_NAME]} for room in rooms],
-                        mode="dropdown",
-                    )
-                )
-            }
-        )
-        return self.async_show_form(step_id="edit_room_select", data_schema=schema)
+        return self.async_show_form(step_id="edit_room_select", data_schema=_room_select_schema(rooms))
 
     async def async_step_edit_room(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
-        rooms = self._current_rooms()
-        selected = self._selected_room_id
-        room = next((item for item in rooms if item[CONF_ROOM_ID] == selected), None)
+        rooms_by_id = self._rooms_by_id()
+        room = rooms_by_id.get(self._selected_room_id)
         if room is None:
             return self.async_abort(reason="room_not_found")
 
         if user_input is not None:
+            room_id = room[CONF_ROOM_ID]
             try:
-                updated = self._build_room_payload(user_input, room_id=room[CONF_ROOM_ID])
-                updated_rooms = [
-                    updated if item[CONF_ROOM_ID] == room[CONF_ROOM_ID] else item
-                    for item in rooms
-                ]
-                return self._create_entry_with_rooms(updated_rooms)
-            except Exception:
+                rooms_by_id[room_id] = _build_room_payload(user_input, room_id)
+            except (TypeError, ValueError):
                 errors["base"] = "invalid_room_json"
+            else:
+                return self._create_entry_with_rooms(list(rooms_by_id.values()))
 
         return self.async_show_form(
             step_id="edit_room",
-            data_schema=self._room_schema(room),
+            data_schema=_room_schema(room),
             errors=errors,
         )
 
     async def async_step_delete_room_select(self, user_input: dict[str, Any] | None = None):
-        rooms = self._current_rooms()
+        rooms = self._rooms_view()
         if not rooms:
             return self.async_abort(reason="no_rooms")
 
-        room_ids = {room[CONF_ROOM_ID] for room in rooms}
+        room_ids = self._room_ids()
         if user_input is not None:
             selected = user_input["room_id"]
             if selected in room_ids:
                 self._selected_room_id = selected
                 return await self.async_step_delete_room_confirm()
 
-        schema = vol.Schema(
-            {
-                vol.Required("room_id"): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[{"value": room[CONF_ROOM_ID], "label": room[CONF_ROOM_NAME]} for room in rooms],
-                        mode="dropdown",
-                    )
-                )
-            }
-        )
-        return self.async_show_form(step_id="delete_room_select", data_schema=schema)
+        return self.async_show_form(step_id="delete_room_select", data_schema=_room_select_schema(rooms))
 
     async def async_step_delete_room_confirm(self, user_input: dict[str, Any] | None = None):
-        rooms = self._current_rooms()
-        selected = self._selected_room_id
-        room = next((item for item in rooms if item[CONF_ROOM_ID] == selected), None)
+        rooms_by_id = self._rooms_by_id()
+        room = rooms_by_id.get(self._selected_room_id)
         if room is None:
             return self.async_abort(reason="room_not_found")
 
         if user_input is not None:
             if user_input.get("confirm_delete", False):
-                updated_rooms = [item for item in rooms if item[CONF_ROOM_ID] != room[CONF_ROOM_ID]]
-                return self._create_entry_with_rooms(updated_rooms)
+                del rooms_by_id[room[CONF_ROOM_ID]]
+                return self._create_entry_with_rooms(list(rooms_by_id.values()))
             return self.async_abort(reason="delete_cancelled")
 
-        schema = vol.Schema(
-            {
-                vol.Required("confirm_delete", default=False): bool,
-            }
-        )
-        return self.async_show_form(step_id="delete_room_confirm", data_schema=schema)
+        return self.async_show_form(step_id="delete_room_confirm", data_schema=_delete_confirm_schema())
 
-    def _create_entry_with_rooms(self, rooms: list[dict[str, Any]]) -> config_entries.ConfigFlowResult:
-        options = dict(self._entry.options)
-        options[CONF_ROOMS] = rooms
-        self._sanitize_room_dependent_options(options, {room[CONF_ROOM_ID] for room in rooms})
+    def _create_entry_with_rooms(self, rooms: list[Mapping[str, Any]]) -> config_entries.ConfigFlowResult:
+        options = {**self._entry.options, CONF_ROOMS: rooms}
+        self._sanitize_room_dependent_options(options, _room_id_set(rooms))
         return self.async_create_entry(title="", data=options)
 
-    def _room_ids(self) -> list[str]:
-        return [room[CONF_ROOM_ID] for room in self._current_rooms()]
+    def _rooms_view(self) -> Sequence[Mapping[str, Any]]:
+        """Return the stored rooms by reference; callers build new lists to change them."""
+        if CONF_ROOMS in self._entry.options:
+            return self._entry.options[CONF_ROOMS]
+        return self._entry.data.get(CONF_ROOMS, [])
 
-    def _current_rooms(self) -> list[dict[str, Any]]:
-        merged = {**self._entry.data, **self._entry.options}
-        rooms_data = merged.get(CONF_ROOMS, [])
-        return [dict(room) for room in rooms_data]
+    def _room_ids(self) -> set[str]:
+        """Return the stored room ids, computed once per flow session."""
+        if self._stored_room_ids is None:
+            self._stored_room_ids = _room_id_set(self._rooms_view())
+        return self._stored_room_ids
 
-    @staticmethod
-    def _build_room_payload(user_input: dict[str, Any], room_id: str) -> dict[str, Any]:
-        dumb_devices = parse_dumb_devices_json(user_input.get("dumb_devices_json", ""))
-        return {
-            CONF_ROOM_ID: room_id,
-            CONF_ROOM_NAME: user_input[CONF_ROOM_NAME],
-            CONF_ROOM_TEMP_SENSORS: user_input.get(CONF_ROOM_TEMP_SENSORS, []),
-            CONF_ROOM_HEAT_CATEGORY_1: user_input.get(CONF_ROOM_HEAT_CATEGORY_1, []),
-            CONF_ROOM_HEAT_CATEGORY_2: user_input.get(CONF_ROOM_HEAT_CATEGORY_2, []),
-            CONF_ROOM_HEAT_CATEGORY_3: user_input.get(CONF_ROOM_HEAT_CATEGORY_3, []),
-            CONF_ROOM_COOL_CATEGORY_1: user_input.get(CONF_ROOM_COOL_CATEGORY_1, []),
-            CONF_ROOM_COOL_CATEGORY_2: user_input.get(CONF_ROOM_COOL_CATEGORY_2, []),
-            CONF_ROOM_COOL_CATEGORY_3: user_input.get(CONF_ROOM_COOL_CATEGORY_3, []),
-            CONF_ROOM_WEATHER_SENSITIVE_CLIMATES: user_input.get(CONF_ROOM_WEATHER_SENSITIVE_CLIMATES, []),
-            CONF_ROOM_SHARED_CLIMATES: user_input.get(CONF_ROOM_SHARED_CLIMATES, []),
-            CONF_ROOM_HEAT_ONLY_CLIMATES: user_input.get(CONF_ROOM_HEAT_ONLY_CLIMATES, []),
-            CONF_ROOM_DUMB_DEVICES: dumb_devices,
-        }
-
-    @staticmethod
-    def _room_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
-        room = defaults or {}
-        return vol.Schema(
-            {
-                vol.Required(CONF_ROOM_NAME, default=room.get(CONF_ROOM_NAME, "")): TextSelector(TextSelectorConfig()),
-                vol.Required(
-                    CONF_ROOM_TEMP_SENSORS,
-                    default=room.get(CONF_ROOM_TEMP_SENSORS, []),
-                ): EntitySelector(EntitySelectorConfig(domain="sensor", multiple=True)),
-                vol.Optional(CONF_ROOM_HEAT_CATEGORY_1, default=room.get(CONF_ROOM_HEAT_CATEGORY_1, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_HEAT_CATEGORY_2, default=room.get(CONF_ROOM_HEAT_CATEGORY_2, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_HEAT_CATEGORY_3, default=room.get(CONF_ROOM_HEAT_CATEGORY_3, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_COOL_CATEGORY_1, default=room.get(CONF_ROOM_COOL_CATEGORY_1, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_COOL_CATEGORY_2, default=room.get(CONF_ROOM_COOL_CATEGORY_2, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(CONF_ROOM_COOL_CATEGORY_3, default=room.get(CONF_ROOM_COOL_CATEGORY_3, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(
-                    CONF_ROOM_WEATHER_SENSITIVE_CLIMATES,
-                    default=room.get(CONF_ROOM_WEATHER_SENSITIVE_CLIMATES, []),
-                ): EntitySelector(EntitySelectorConfig(domain="climate", multiple=True)),
-                vol.Optional(CONF_ROOM_SHARED_CLIMATES, default=room.get(CONF_ROOM_SHARED_CLIMATES, [])): EntitySelector(
-                    EntitySelectorConfig(domain="climate", multiple=True)
-                ),
-                vol.Optional(
-                    CONF_ROOM_HEAT_ONLY_CLIMATES,
-                    default=room.get(CONF_ROOM_HEAT_ONLY_CLIMATES, []),
-                ): EntitySelector(EntitySelectorConfig(domain="climate", multiple=True)),
-                vol.Optional(
-                    "dumb_devices_json",
-                    default=json.dumps(room.get(CONF_ROOM_DUMB_DEVICES, []), ensure_ascii=False),
-                ): TextSelector(TextSelectorConfig(multiline=True)),
-            }
-        )
+    def _rooms_by_id(self) -> dict[str, Mapping[str, Any]]:
+        """Index the stored rooms by id, keeping their order."""
+        return {room[CONF_ROOM_ID]: room for room in self._rooms_view()}
 
     @staticmethod
     def _sanitize_room_dependent_options(options: dict[str, Any], room_ids: set[str]) -> None:
@@ -688,26 +700,10 @@ class SmartClimateOptionsFlow(config_entries.OptionsFlow):
             if not isinstance(value, dict):
                 options[key] = {}
                 continue
+            if value.keys() <= room_ids:
+                continue
             options[key] = {room_id: item for room_id, item in value.items() if room_id in room_ids}
 
         priority = options.get(CONF_PRIORITY_ROOM, "")
         if priority and priority not in room_ids:
             options[CONF_PRIORITY_ROOM] = ""
-
-    @staticmethod
-    def _parse_json_map(raw: str, cast: type) -> dict[str, Any]:
-        data = json.loads(raw) if raw else {}
-        if not isinstance(data, dict):
-            raise ValueError("json map expected")
-        result: dict[str, Any] = {}
-        for key, value in data.items():
-            if cast is bool:
-                if isinstance(value, bool):
-                    result[str(key)] = value
-                elif isinstance(value, str):
-                    result[str(key)] = value.strip().lower() in ("1", "true", "on", "yes")
-                else:
-                    result[str(key)] = bool(value)
-            else:
-                result[str(key)] = cast(value)
-        return result
@@ -8,7 +8,7 @@ DOMAIN = "smart_climate"
 NAME = "Умный климат"
 VERSION = "0.1.36"
 
-PLATFORMS = ["select", "number", "switch", "sensor"]
+PLATFORMS = ("select", "number", "switch", "sensor")
 
 CONF_OUTDOOR_SOURCE_TYPE = "outdoor_source_type"
 CONF_OUTDOOR_WEATHER = "outdoor_weather"
@@ -150,9 +150,13 @@ DEFAULT_AC_MISSING_OUTDOOR_POLICY = OUTDOOR_POLICY_BLOCK
 DEFAULT_AGGREGATION = AGGREGATION_AVERAGE
 
 COORDINATOR_DEBOUNCE_SECONDS = 3
+# Re-send an identical climate command only after this long without the device confirming it.
+COMMAND_RESEND_SECONDS = 900
 
 UPDATE_FAILED_WARNING = "Smart Climate update failed"
 
+TRUTHY_STRINGS = frozenset(("1", "true", "on", "yes"))
+
 OPTIONS_DEFAULTS: dict[str, object] = {
     CONF_MODE: DEFAULT_MODE,
     CONF_TYPE: DEFAULT_TYPE,
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import defaultdict
+import time
+from collections import ChainMap, defaultdict
+from collections.abc import Callable
 from datetime import timedelta
+from functools import cache
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HassJobType, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -23,6 +26,7 @@ except ImportError:  # pragma: no cover - fallback for lightweight test stubs
         return value.strip().lower()
 
 from .const import (
+    COMMAND_RESEND_SECONDS,
     CONF_AC_MISSING_OUTDOOR_POLICY,
     CONF_AGGREGATION,
     CONF_COOL_BIG,
@@ -109,6 +113,10 @@ from .models import DeviceActionState, DumbDeviceConfig, RoomConfig, RoomRuntime
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNUSABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+_HEAT_HVAC_MODE = mode_hvac(True)
+_COOL_HVAC_MODE = mode_hvac(False)
+
 
 class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Central coordinator for Smart Climate logic."""
@@ -136,8 +144,14 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._rooms: dict[str, RoomConfig] = {}
         self._runtime: dict[str, RoomRuntime] = {}
         self._device_state: dict[str, DeviceActionState] = defaultdict(DeviceActionState)
-        self._shared_map: dict[str, list[str]] = defaultdict(list)
+        self._shared_map: dict[str, tuple[str, ...]] = {}
         self._managed_dumb_on_scripts: set[str] = set()
+        self._watched_entity_ids: tuple[str, ...] = ()
+        self._room_static_payloads: dict[str, dict[str, Any]] = {}
+        self._idle_cycle_key: tuple[Any, ...] | None = None
+        self._cycle_needs_rerun = False
+        # Resolved options, kept only while a control cycle is running.
+        self._cycle_opts: dict[str, Any] | None = None
         self._overrides: dict[str, Any] = {
             CONF_PER_ROOM_TARGETS: {},
             CONF_PER_ROOM_TOLERANCES: {},
@@ -156,11 +170,12 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._unsub_listeners.clear()
 
     def _load_configuration(self) -> None:
-        merged = {**self.config_entry.data, **self.config_entry.options}
+        merged = ChainMap(self.config_entry.options, self.config_entry.data)
         rooms_data: list[dict[str, Any]] = merged.get(CONF_ROOMS, [])
 
         self._rooms.clear()
-        self._shared_map.clear()
+        self._room_static_payloads.clear()
+        shared_map: defaultdict[str, list[str]] = defaultdict(list)
         configured_dumb_on_scripts: set[str] = set()
 
         for room_data in rooms_data:
@@ -213,47 +228,102 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._runtime.setdefault(room.room_id, RoomRuntime())
 
             for climate_id in room.shared_climates:
-                self._shared_map[climate_id].append(room.room_id)
+                shared_map[climate_id].append(room.room_id)
+        self._shared_map = {climate_id: tuple(room_ids) for climate_id, room_ids in shared_map.items()}
 
         # Keep tracking state only for currently configured dumb devices.
         self._managed_dumb_on_scripts.intersection_update(configured_dumb_on_scripts)
 
+        watched: dict[str, None] = {}
+        for room in self._rooms.values():
+            for entity_ids in (
+                room.temp_sensors,
+                room.heat_category_1,
+                room.heat_category_2,
+                room.heat_category_3,
+                room.cool_category_1,
+                room.cool_category_2,
+                room.cool_category_3,
+                room.shared_climates,
+            ):
+                watched.update(dict.fromkeys(entity_ids))
+            for dumb in room.dumb_devices:
+                watched.update(dict.fromkeys((dumb.on_script, dumb.off_script)))
+        for key in (CONF_OUTDOOR_WEATHER, CONF_OUTDOOR_SENSOR):
+            if entity_id := self._opt(key):
+                watched[entity_id] = None
+        self._watched_entity_ids = tuple(watched)
+        self._idle_cycle_key = None
+
         self._sync_update_interval()
 
     def _setup_listeners(self) -> None:
-        entities: set[str] = set()
+        sensor_entities: set[str] = set()
         for room in self._rooms.values():
-            entities.update(room.temp_sensors)
+            sensor_entities.update(room.temp_sensors)
 
+        weather_entity: str | None = None
         outdoor_type = self._opt(CONF_OUTDOOR_SOURCE_TYPE)
         if outdoor_type == OUTDOOR_SOURCE_WEATHER:
-            weather_entity = self._opt(CONF_OUTDOOR_WEATHER)
-            if weather_entity:
-                entities.add(weather_entity)
+            weather_entity = self._opt(CONF_OUTDOOR_WEATHER) or None
         elif outdoor_type == OUTDOOR_SOURCE_SENSOR:
             sensor_entity = self._opt(CONF_OUTDOOR_SENSOR)
             if sensor_entity:
-                entities.add(sensor_entity)
+                sensor_entities.add(sensor_entity)
 
+        entities = list(sensor_entities)
+        if weather_entity and weather_entity not in sensor_entities:
+            entities.append(weather_entity)
         if not entities:
             return
 
+        # Only the value the control loop reads matters: state for sensors,
+        # the temperature attribute for weather entities.
+        last_values: dict[str, Any] = {}
+
+        def _tracked_value(entity_id: str, state: Any) -> Any:
+            if state is None:
+                return None
+            if entity_id == weather_entity:
+                return state.attributes.get("temperature")
+            return state.state
+
         @callback
-        def _async_state_changed(_event: Event) -> None:
-            self.async_request_refresh()
+        def _async_state_changed(event: Event) -> None:
+            entity_id = event.data["entity_id"]
+            value = _tracked_value(entity_id, event.data["new_state"])
+            if entity_id in last_values:
+                previous = last_values[entity_id]
+            else:
+                previous = _tracked_value(entity_id, event.data.get("old_state"))
+            last_values[entity_id] = value
+            if previous != value:
+                self._debounced_refresh.async_schedule_call()
 
         self._unsub_listeners.append(
-            async_track_state_change_event(self.hass, list(entities), _async_state_changed)
+            async_track_state_change_event(
+                self.hass,
+                entities,
+                _async_state_changed,
+                job_type=HassJobType.Callback,
+            )
         )
 
     def _opt(self, key: str) -> Any:
+        cycle_opts = self._cycle_opts
+        if cycle_opts is not None and key in cycle_opts:
+            return cycle_opts[key]
         if override := self._overrides.get(key):
-            return override
-        if key in self.config_entry.options:
-            return self.config_entry.options[key]
-        if key in self.config_entry.data:
-            return self.config_entry.data[key]
-        return OPTIONS_DEFAULTS.get(key)
+            value = override
+        elif key in self.config_entry.options:
+            value = self.config_entry.options[key]
+        elif key in self.config_entry.data:
+            value = self.config_entry.data[key]
+        else:
+            value = OPTIONS_DEFAULTS.get(key)
+        if cycle_opts is not None:
+            cycle_opts[key] = value
+        return value
 
     def _room_target(self, room_id: str) -> float:
         mode = self._opt(CONF_MODE)
@@ -317,17 +387,9 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     @staticmethod
     def _room_has_capability(room: RoomConfig, is_heating: bool) -> bool:
-        if is_heating:
-            category_entities = merge_categories(
-                room.heat_category_1, room.heat_category_2, room.heat_category_3, 3
-            )
-        else:
-            category_entities = merge_categories(
-                room.cool_category_1, room.cool_category_2, room.cool_category_3, 3
-            )
-
+        category_entities = room.heat_entities if is_heating else room.cool_entities
         has_room_entities = any(
-            not (entity_id.startswith("climate.") and entity_id in room.shared_climates)
+            not (entity_id.startswith("climate.") and entity_id in room.shared_climate_set)
             for entity_id in category_entities
         )
         if has_room_entities:
@@ -378,11 +440,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
         }
 
-        all_room_climates = {
-            entity_id
-            for entity_id in self._room_mode_entities(room, True, 3) | self._room_mode_entities(room, False, 3)
-            if entity_id.startswith("climate.")
-        }
+        all_room_climates = room.room_climates
         climates_to_turn_off = all_room_climates - active_current_climates - set(room.shared_climates)
         for climate_entity in climates_to_turn_off:
             if await self._async_call_service_entity(climate_entity, "climate", "turn_off"):
@@ -414,20 +472,21 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
 
     def _persist_option(self, key: str, value: Any) -> None:
-        options = dict(self.config_entry.options)
-        if options.get(key) == value:
+        self._idle_cycle_key = None
+        if self.config_entry.options.get(key) == value:
             return
+        options = dict(self.config_entry.options)
         options[key] = value
         self.hass.config_entries.async_update_entry(self.config_entry, options=options)
 
     def _persist_option_map_value(self, key: str, map_key: str, value: Any) -> None:
-        options = dict(self.config_entry.options)
-        current_raw = options.get(key, {})
-        current_map = dict(current_raw) if isinstance(current_raw, dict) else {}
+        self._idle_cycle_key = None
+        current_raw = self.config_entry.options.get(key)
+        current_map = current_raw if isinstance(current_raw, dict) else {}
         if current_map.get(map_key) == value:
             return
-        current_map[map_key] = value
-        options[key] = current_map
+        options = dict(self.config_entry.options)
+        options[key] = {**current_map, map_key: value}
         self.hass.config_entries.async_update_entry(self.config_entry, options=options)
 
     async def async_set_mode(self, value: str) -> None:
@@ -468,284 +527,373 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         self._sync_update_interval()
         async with self._lock:
+            cycle_key = self._cycle_input_key()
+            if cycle_key is not None and cycle_key == self._idle_cycle_key and self.data is not None:
+                # Same inputs as a cycle that changed nothing: it would decide the same.
+                return self.data
+            self._cycle_needs_rerun = False
+            # Options are constant for the whole cycle, so every helper resolves each
+            # key at most once instead of walking overrides/options/data/defaults.
+            self._cycle_opts = {}
             try:
-                return await self._async_run_control_cycle()
+                data = await self._async_run_control_cycle()
             except Exception as err:
                 raise UpdateFailed(UPDATE_FAILED_WARNING) from err
+            finally:
+                self._cycle_opts = None
+            if cycle_key is not None and not self._cycle_needs_rerun:
+                self._idle_cycle_key = cycle_key if self._cycle_input_key() == cycle_key else None
+            else:
+                self._idle_cycle_key = None
+            return data
+
+    def _cycle_input_key(self) -> tuple[Any, ...] | None:
+        """Snapshot everything a control cycle reads, or None when time matters.
+
+        The key only covers states and runtime. Every deferred or time-based path
+        (the anti-flap deferral in _can_act, sent commands, the resend dedupe) must
+        set _cycle_needs_rerun, otherwise an unchanged key skips the retry.
+        """
+        runtime_key = []
+        for room_id, runtime in self._runtime.items():
+            if runtime.phase == PHASE_BOOST:
+                return None
+            runtime_key.append(
+                (room_id, runtime.phase, runtime.current_offset, runtime.hold_is_heating)
+            )
+        get_state = self.hass.states.get
+        return (
+            tuple(runtime_key),
+            frozenset(self._managed_dumb_on_scripts),
+            tuple(get_state(entity_id) for entity_id in self._watched_entity_ids),
+        )
 
     async def _async_run_control_cycle(self) -> dict[str, Any]:
         mode = self._opt(CONF_MODE)
         control_type = self._opt(CONF_TYPE)
         outdoor_temp = self._read_outdoor_temp()
+
+        @cache
+        def category_thresholds(is_heating: bool) -> Thresholds:
+            if is_heating:
+                return Thresholds(
+                    float(self._opt(CONF_HEAT_CATEGORY2_DIFF) or self._opt(CONF_HEAT_MEDIUM)),
+                    float(self._opt(CONF_HEAT_CATEGORY3_DIFF) or self._opt(CONF_HEAT_BIG)),
+                )
+            return Thresholds(
+                float(self._opt(CONF_COOL_CATEGORY2_DIFF) or self._opt(CONF_COOL_MEDIUM)),
+                float(self._opt(CONF_COOL_CATEGORY3_DIFF) or self._opt(CONF_COOL_BIG)),
+            )
+
         room_payload: dict[str, Any] = {}
-        shared_demands: dict[str, list[tuple[str, str, float]]] = defaultdict(list)
+        # Every shared climate a room can report is a key of the shared map.
+        shared_demands: dict[str, list[tuple[str, str, float]]] = {
+            climate_entity: [] for climate_entity in self._shared_map
+        }
 
         for room_id, room in self._rooms.items():
-            runtime = self._runtime[room_id]
-            phase_reason: str | None = None
-            demand = "none"
-            demand_delta = 0.0
-            runtime.action_log = []
-            runtime.decision_summary = None
-            runtime.boost_elapsed_seconds = 0
-            runtime.enabled = self._room_enabled(room_id)
-            runtime.target_temp = self._room_target(room_id)
-            runtime.tolerance = self._room_tolerance(room_id)
-            runtime.current_temp = self._read_room_temperature(room)
-            runtime.active_devices = []
-            runtime.active_category_heat = 0
-            runtime.active_category_cool = 0
-
-            if runtime.current_temp is None:
-                _LOGGER.debug("Room %s has no valid temp sensors", room_id)
-                runtime.enabled = False
-                runtime.phase = PHASE_IDLE
-                phase_reason = "no_temperature"
-                runtime.decision_summary = "room excluded: no valid temperature sensor data"
-                room_payload[room_id] = self._room_payload(
+            payload, room_demands = await self._async_process_room(
+                room_id,
+                room,
+                category_thresholds=category_thresholds,
+                mode=mode,
+                control_type=control_type,
+                outdoor_temp=outdoor_temp,
+            )
+            room_payload[room_id] = payload
+            for shared, entry in room_demands:
+                shared_demands[shared].append(entry)
+
+        shared_winner_rooms: dict[str, str] = {}
+        if mode != MODE_OFF:
+            shared_winner_rooms = await self._async_apply_shared(shared_demands, outdoor_temp)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Control cycle: mode=%s type=%s outdoor=%s phases=%s shared=%s",
+                mode,
+                control_type,
+                outdoor_temp,
+                {room_id: payload["phase_reason"] or payload["phase"] for room_id, payload in room_payload.items()},
+                shared_winner_rooms,
+            )
+
+        return {
+            "mode": mode,
+            "type": control_type,
+            "global_target": self._opt(CONF_GLOBAL_TARGET),
+            "global_tolerance": self._opt(CONF_GLOBAL_TOLERANCE),
+            "outdoor_temp": outdoor_temp,
+            "shared_winner_rooms": shared_winner_rooms,
+            "rooms": room_payload,
+        }
+
+    async def _async_process_room(
+        self,
+        room_id: str,
+        room: RoomConfig,
+        *,
+        category_thresholds: Callable[[bool], Thresholds],
+        mode: str,
+        control_type: str,
+        outdoor_temp: float | None,
+    ) -> tuple[dict[str, Any], list[tuple[str, tuple[str, str, float]]]]:
+        """Run one room's control step and return its payload and shared demands."""
+        shared_demands: list[tuple[str, tuple[str, str, float]]] = []
+        runtime = self._runtime[room_id]
+        phase_reason: str | None = None
+        demand = "none"
+        demand_delta = 0.0
+        runtime.action_log = []
+        runtime.decision_summary = None
+        runtime.boost_elapsed_seconds = 0
+        runtime.enabled = self._room_enabled(room_id)
+        runtime.target_temp = self._room_target(room_id)
+        runtime.tolerance = self._room_tolerance(room_id)
+        runtime.current_temp = self._read_room_temperature(room)
+        runtime.active_devices = []
+        runtime.active_category_heat = 0
+        runtime.active_category_cool = 0
+
+        if runtime.current_temp is None:
+            _LOGGER.debug("Room %s has no valid temp sensors", room_id)
+            runtime.enabled = False
+            runtime.phase = PHASE_IDLE
+            phase_reason = "no_temperature"
+            runtime.decision_summary = "room excluded: no valid temperature sensor data"
+            return (
+                self._room_payload(
                     room,
                     runtime,
                     phase_reason=phase_reason,
                     demand=demand,
                     demand_delta=demand_delta,
-                )
-                continue
+                ),
+                shared_demands,
+            )
 
-            if mode == MODE_OFF or not runtime.enabled:
-                runtime.phase = PHASE_IDLE
-                phase_reason = "mode_off" if mode == MODE_OFF else "room_disabled"
-                runtime.decision_summary = (
-                    "automation disabled: mode off" if mode == MODE_OFF else "room disabled by user"
-                )
-                room_payload[room_id] = self._room_payload(
+        if mode == MODE_OFF or not runtime.enabled:
+            runtime.phase = PHASE_IDLE
+            phase_reason = "mode_off" if mode == MODE_OFF else "room_disabled"
+            runtime.decision_summary = (
+                "automation disabled: mode off" if mode == MODE_OFF else "room disabled by user"
+            )
+            return (
+                self._room_payload(
                     room,
                     runtime,
                     phase_reason=phase_reason,
                     demand=demand,
                     demand_delta=demand_delta,
-                )
-                continue
+                ),
+                shared_demands,
+            )
 
-            target = runtime.target_temp
-            tolerance = runtime.tolerance
-            diff_heat = target - runtime.current_temp
-            diff_cool = runtime.current_temp - target
-            heat_needed = diff_heat > tolerance
-            cool_needed = diff_cool > tolerance
-            reached = within_target(runtime.current_temp, target, tolerance)
-            switch_hysteresis = float(self._opt(CONF_DIRECTION_SWITCH_HYSTERESIS) or 0.0)
-            if switch_hysteresis > 0 and runtime.hold_is_heating is not None:
-                switch_threshold = tolerance + switch_hysteresis
-                if runtime.hold_is_heating:
-                    cool_needed = diff_cool > switch_threshold
-                else:
-                    heat_needed = diff_heat > switch_threshold
-            softened_offset_on_overshoot = False
-            if (
-                runtime.phase == PHASE_HOLD
-                and runtime.current_offset > 0
-                and runtime.hold_is_heating is not None
-            ):
-                decay_step = float(
-                    self._opt(CONF_HOLD_OFFSET_DECAY_STEP)
-                    or OPTIONS_DEFAULTS[CONF_HOLD_OFFSET_DECAY_STEP]
-                )
-                if runtime.hold_is_heating and cool_needed:
-                    runtime.current_offset = max(0.0, runtime.current_offset - decay_step)
-                    cool_needed = False
-                    softened_offset_on_overshoot = True
-                elif not runtime.hold_is_heating and heat_needed:
-                    runtime.current_offset = max(0.0, runtime.current_offset - decay_step)
-                    heat_needed = False
-                    softened_offset_on_overshoot = True
-
-            if runtime.phase == PHASE_HOLD and not reached and not softened_offset_on_overshoot:
-                if heat_needed:
-                    if should_reenter_boost(
-                        runtime.current_temp,
-                        target,
-                        tolerance,
-                        float(self._opt(CONF_DELTA)),
-                        is_heating=True,
-                    ):
-                        runtime.phase = PHASE_BOOST
-                elif cool_needed:
-                    if should_reenter_boost(
-                        runtime.current_temp,
-                        target,
-                        tolerance,
-                        float(self._opt(CONF_DELTA)),
-                        is_heating=False,
-                    ):
-                        runtime.phase = PHASE_BOOST
-
-            if runtime.phase == PHASE_BOOST and runtime.boost_started_at is None:
-                runtime.boost_started_at = dt_util.utcnow()
-
-            elapsed = 0.0
-            if runtime.boost_started_at is not None:
-                elapsed = (dt_util.utcnow() - runtime.boost_started_at).total_seconds()
-            runtime.boost_elapsed_seconds = int(elapsed)
-
-            runtime.phase, runtime.current_offset = next_phase_and_offset(
+        target = runtime.target_temp
+        tolerance = runtime.tolerance
+        diff_heat = target - runtime.current_temp
+        diff_cool = runtime.current_temp - target
+        heat_needed = diff_heat > tolerance
+        cool_needed = diff_cool > tolerance
+        reached = within_target(runtime.current_temp, target, tolerance)
+        switch_hysteresis = float(self._opt(CONF_DIRECTION_SWITCH_HYSTERESIS) or 0.0)
+        if switch_hysteresis > 0 and runtime.hold_is_heating is not None:
+            switch_threshold = tolerance + switch_hysteresis
+            if runtime.hold_is_heating:
+                cool_needed = diff_cool > switch_threshold
+            else:
+                heat_needed = diff_heat > switch_threshold
+        softened_offset_on_overshoot = False
+        if (
+            runtime.phase == PHASE_HOLD
+            and runtime.current_offset > 0
+            and runtime.hold_is_heating is not None
+        ):
+            decay_step = float(
+                self._opt(CONF_HOLD_OFFSET_DECAY_STEP)
+                or OPTIONS_DEFAULTS[CONF_HOLD_OFFSET_DECAY_STEP]
+            )
+            if runtime.hold_is_heating and cool_needed:
+                runtime.current_offset = max(0.0, runtime.current_offset - decay_step)
+                cool_needed = False
+                softened_offset_on_overshoot = True
+            elif not runtime.hold_is_heating and heat_needed:
+                runtime.current_offset = max(0.0, runtime.current_offset - decay_step)
+                heat_needed = False
+                softened_offset_on_overshoot = True
+
+        if runtime.phase == PHASE_HOLD and not reached and not softened_offset_on_overshoot:
+            if heat_needed:
+                if should_reenter_boost(
+                    runtime.current_temp,
+                    target,
+                    tolerance,
+                    float(self._opt(CONF_DELTA)),
+                    is_heating=True,
+                ):
+                    runtime.phase = PHASE_BOOST
+            elif cool_needed:
+                if should_reenter_boost(
+                    runtime.current_temp,
+                    target,
+                    tolerance,
+                    float(self._opt(CONF_DELTA)),
+                    is_heating=False,
+                ):
+                    runtime.phase = PHASE_BOOST
+
+        now = time.monotonic()
+        if runtime.phase == PHASE_BOOST and runtime.boost_started_monotonic is None:
+            runtime.boost_started_monotonic = now
+
+        elapsed = 0.0
+        if runtime.boost_started_monotonic is not None:
+            elapsed = now - runtime.boost_started_monotonic
+        runtime.boost_elapsed_seconds = int(elapsed)
+
+        runtime.phase, runtime.current_offset = next_phase_and_offset(
+            control_type=control_type,
+            phase=runtime.phase,
+            reached_target=reached or softened_offset_on_overshoot,
+            current_offset=runtime.current_offset,
+            step_offset=float(self._opt(CONF_STEP_OFFSET)),
+            max_offset=float(self._opt(CONF_MAX_OFFSET)),
+            elapsed_boost_seconds=elapsed,
+            t_time=float(self._opt(CONF_T_TIME)),
+        )
+
+        if runtime.phase == PHASE_HOLD:
+            runtime.last_reach_time = dt_util.utcnow()
+            runtime.boost_started_monotonic = None
+
+        if heat_needed:
+            demand = "heat"
+            demand_delta = diff_heat
+            runtime.hold_is_heating = True
+            weather_sensitive_allowed = self._weather_sensitive_allowed(
+                outdoor_temp=outdoor_temp,
+                target=target,
+                is_heating=True,
+                control_type=control_type,
+            )
+            if not self._room_has_capability(room, is_heating=True):
+                phase_reason = "no_heating_devices"
+            category = select_category(
+                diff_heat,
+                category_thresholds(True),
+                weather_sensitive_allowed,
+            )
+            runtime.active_category_heat = category
+            runtime.active_devices = await self._async_apply_room_actions(
+                room,
+                runtime,
+                is_heating=True,
+                category=category,
                 control_type=control_type,
-                phase=runtime.phase,
-                reached_target=reached or softened_offset_on_overshoot,
-                current_offset=runtime.current_offset,
-                step_offset=float(self._opt(CONF_STEP_OFFSET)),
-                max_offset=float(self._opt(CONF_MAX_OFFSET)),
-                elapsed_boost_seconds=elapsed,
-                t_time=float(self._opt(CONF_T_TIME)),
+                weather_sensitive_allowed=weather_sensitive_allowed,
+            )
+            if phase_reason is None and not runtime.active_devices:
+                phase_reason = "no_devices_activated"
+            for shared in room.shared_climates:
+                shared_demands.append((shared, (room_id, "heat", diff_heat)))
+            runtime.decision_summary = (
+                f"heat category {category}: diff={diff_heat:.2f}C, "
+                f"tol={tolerance:.2f}C, boost={runtime.boost_elapsed_seconds}s"
             )
 
-            if runtime.phase == PHASE_HOLD:
-                runtime.last_reach_time = dt_util.utcnow()
-                runtime.boost_started_at = None
+        elif cool_needed:
+            demand = "cool"
+            demand_delta = diff_cool
+            runtime.hold_is_heating = False
+            weather_sensitive_allowed = self._weather_sensitive_allowed(
+                outdoor_temp=outdoor_temp,
+                target=target,
+                is_heating=False,
+                control_type=control_type,
+            )
+            if not self._room_has_capability(room, is_heating=False):
+                phase_reason = "no_cooling_devices"
+            category = select_category(
+                diff_cool,
+                category_thresholds(False),
+                weather_sensitive_allowed,
+            )
+            runtime.active_category_cool = category
+            runtime.active_devices = await self._async_apply_room_actions(
+                room,
+                runtime,
+                is_heating=False,
+                category=category,
+                control_type=control_type,
+                weather_sensitive_allowed=weather_sensitive_allowed,
+            )
+            if phase_reason is None and not runtime.active_devices:
+                phase_reason = "no_devices_activated"
+            for shared in room.shared_climates:
+                shared_demands.append((shared, (room_id, "cool", diff_cool)))
+            runtime.decision_summary = (
+                f"cool category {category}: diff={diff_cool:.2f}C, "
+                f"tol={tolerance:.2f}C, boost={runtime.boost_elapsed_seconds}s"
+            )
 
-            if heat_needed:
-                demand = "heat"
-                demand_delta = diff_heat
-                runtime.hold_is_heating = True
-                weather_sensitive_allowed = self._weather_sensitive_allowed(
-                    outdoor_temp=outdoor_temp,
-                    target=target,
-                    is_heating=True,
-                    control_type=control_type,
-                )
-                if not self._room_has_capability(room, is_heating=True):
-                    phase_reason = "no_heating_devices"
-                category = select_category(
-                    diff_heat,
-                    Thresholds(
-                        float(self._opt(CONF_HEAT_CATEGORY2_DIFF) or self._opt(CONF_HEAT_MEDIUM)),
-                        float(self._opt(CONF_HEAT_CATEGORY3_DIFF) or self._opt(CONF_HEAT_BIG)),
-                    ),
-                    weather_sensitive_allowed,
-                )
-                runtime.active_category_heat = category
-                runtime.active_devices = await self._async_apply_room_actions(
-                    room,
-                    runtime,
-                    is_heating=True,
-                    category=category,
-                    control_type=control_type,
-                    weather_sensitive_allowed=weather_sensitive_allowed,
-                )
-                if phase_reason is None and not runtime.active_devices:
-                    phase_reason = "no_devices_activated"
-                for shared in room.shared_climates:
-                    shared_demands[shared].append((room_id, "heat", diff_heat))
-                runtime.decision_summary = (
-                    f"heat category {category}: diff={diff_heat:.2f}C, "
-                    f"tol={tolerance:.2f}C, boost={runtime.boost_elapsed_seconds}s"
-                )
+        elif runtime.phase == PHASE_HOLD:
+            hold_is_heating = runtime.hold_is_heating
+            if hold_is_heating is None:
+                if self._room_has_capability(room, is_heating=True):
+                    hold_is_heating = True
+                elif self._room_has_capability(room, is_heating=False):
+                    hold_is_heating = False
 
-            elif cool_needed:
-                demand = "cool"
-                demand_delta = diff_cool
-                runtime.hold_is_heating = False
+            if hold_is_heating is not None:
                 weather_sensitive_allowed = self._weather_sensitive_allowed(
                     outdoor_temp=outdoor_temp,
                     target=target,
-                    is_heating=False,
+                    is_heating=hold_is_heating,
                     control_type=control_type,
                 )
-                if not self._room_has_capability(room, is_heating=False):
-                    phase_reason = "no_cooling_devices"
-                category = select_category(
-                    diff_cool,
-                    Thresholds(
-                        float(self._opt(CONF_COOL_CATEGORY2_DIFF) or self._opt(CONF_COOL_MEDIUM)),
-                        float(self._opt(CONF_COOL_CATEGORY3_DIFF) or self._opt(CONF_COOL_BIG)),
-                    ),
-                    weather_sensitive_allowed,
-                )
-                runtime.active_category_cool = category
                 runtime.active_devices = await self._async_apply_room_actions(
                     room,
                     runtime,
-                    is_heating=False,
-                    category=category,
+                    is_heating=hold_is_heating,
+                    category=1,
                     control_type=control_type,
                     weather_sensitive_allowed=weather_sensitive_allowed,
                 )
-                if phase_reason is None and not runtime.active_devices:
-                    phase_reason = "no_devices_activated"
-                for shared in room.shared_climates:
-                    shared_demands[shared].append((room_id, "cool", diff_cool))
+                if hold_is_heating:
+                    runtime.active_category_heat = 1
+                else:
+                    runtime.active_category_cool = 1
+
+            if softened_offset_on_overshoot:
                 runtime.decision_summary = (
-                    f"cool category {category}: diff={diff_cool:.2f}C, "
-                    f"tol={tolerance:.2f}C, boost={runtime.boost_elapsed_seconds}s"
+                    "hold: softened boost offset due opposite drift, "
+                    f"offset={runtime.current_offset:.2f}"
                 )
-
-            elif runtime.phase == PHASE_HOLD:
-                hold_is_heating = runtime.hold_is_heating
-                if hold_is_heating is None:
-                    if self._room_has_capability(room, is_heating=True):
-                        hold_is_heating = True
-                    elif self._room_has_capability(room, is_heating=False):
-                        hold_is_heating = False
-
-                if hold_is_heating is not None:
-                    weather_sensitive_allowed = self._weather_sensitive_allowed(
-                        outdoor_temp=outdoor_temp,
-                        target=target,
-                        is_heating=hold_is_heating,
-                        control_type=control_type,
-                    )
-                    runtime.active_devices = await self._async_apply_room_actions(
-                        room,
-                        runtime,
-                        is_heating=hold_is_heating,
-                        category=1,
-                        control_type=control_type,
-                        weather_sensitive_allowed=weather_sensitive_allowed,
-                    )
-                    if hold_is_heating:
-                        runtime.active_category_heat = 1
-                    else:
-                        runtime.active_category_cool = 1
-
-                if softened_offset_on_overshoot:
-                    runtime.decision_summary = (
-                        "hold: softened boost offset due opposite drift, "
-                        f"offset={runtime.current_offset:.2f}"
-                    )
-                else:
-                    runtime.decision_summary = (
-                        "target reached: holding setpoint, "
-                        f"offset={runtime.current_offset:.2f}"
-                    )
             else:
-                runtime.decision_summary = "within target band: no demand"
+                runtime.decision_summary = (
+                    "target reached: holding setpoint, "
+                    f"offset={runtime.current_offset:.2f}"
+                )
+        else:
+            runtime.decision_summary = "within target band: no demand"
 
-            room_payload[room_id] = self._room_payload(
+        return (
+            self._room_payload(
                 room,
                 runtime,
                 phase_reason=phase_reason,
                 demand=demand,
                 demand_delta=demand_delta,
-            )
-
-        shared_winner_rooms: dict[str, str] = {}
-        if mode != MODE_OFF:
-            shared_winner_rooms = await self._async_apply_shared(shared_demands)
-
-        return {
-            "mode": self._opt(CONF_MODE),
-            "type": self._opt(CONF_TYPE),
-            "global_target": self._opt(CONF_GLOBAL_TARGET),
-            "global_tolerance": self._opt(CONF_GLOBAL_TOLERANCE),
-            "outdoor_temp": outdoor_temp,
-            "shared_winner_rooms": shared_winner_rooms,
-            "rooms": room_payload,
-        }
+            ),
+            shared_demands,
+        )
 
     def _read_room_temperature(self, room: RoomConfig) -> float | None:
         values: list[float] = []
+        get_state = self.hass.states.get
         for entity_id in room.temp_sensors:
-            state = self.hass.states.get(entity_id)
-            if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            state = get_state(entity_id)
+            if state is None or state.state in _UNUSABLE_STATES:
                 continue
             try:
                 values.append(float(state.state))
@@ -774,7 +922,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return None
             return float(value)
 
-        if state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        if state.state in _UNUSABLE_STATES:
             return None
 
         try:
@@ -828,54 +976,44 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             weather_sensitive_allowed,
         )
 
-        if is_heating:
-            category_entities = merge_categories(
-                room.heat_category_1, room.heat_category_2, room.heat_category_3, category
-            )
-        else:
-            category_entities = merge_categories(
-                room.cool_category_1, room.cool_category_2, room.cool_category_3, category
-            )
-
+        climates, scripts = room.category_actions[(is_heating, category)]
         for entity_id in filter_weather_sensitive(
-            category_entities,
-            set(room.weather_sensitive_climates),
+            climates,
+            room.weather_sensitive_set,
             weather_sensitive_allowed,
         ):
-            if entity_id.startswith("climate."):
-                if entity_id in room.shared_climates:
-                    continue
-                result = await self._async_set_climate(
-                    entity_id,
-                    target=float(runtime.target_temp),
-                    is_heating=is_heating,
-                    control_type=control_type,
-                    offset=runtime.current_offset,
-                    force_heat_mode=entity_id in room.heat_only_climates,
-                )
-                if result["active"]:
-                    active.append(entity_id)
-                    if result["sent"]:
-                        self._log_room_action(
-                            runtime,
-                            entity_id=entity_id,
-                            action="set_climate",
-                            reason="active_category",
-                            category=category,
-                            hvac_mode=result["hvac_mode"],
-                            setpoint=result["setpoint"],
-                        )
-            elif entity_id.startswith("script."):
-                if await self._async_call_service_entity(entity_id, "script", "turn_on"):
-                    active.append(entity_id)
+            result = await self._async_set_climate(
+                entity_id,
+                target=float(runtime.target_temp),
+                is_heating=is_heating,
+                control_type=control_type,
+                offset=runtime.current_offset,
+                force_heat_mode=entity_id in room.heat_only_climates,
+            )
+            if result["active"]:
+                active.append(entity_id)
+                if result["sent"]:
                     self._log_room_action(
                         runtime,
                         entity_id=entity_id,
-                        action="turn_on",
+                        action="set_climate",
                         reason="active_category",
                         category=category,
+                        hvac_mode=result["hvac_mode"],
+                        setpoint=result["setpoint"],
                     )
 
+        for entity_id in scripts:
+            if await self._async_call_service_entity(entity_id, "script", "turn_on"):
+                active.append(entity_id)
+                self._log_room_action(
+                    runtime,
+                    entity_id=entity_id,
+                    action="turn_on",
+                    reason="active_category",
+                    category=category,
+                )
+
         for dumb in room.dumb_devices:
             if not should_activate_dumb_device(
                 room_category=category,
@@ -899,18 +1037,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return active
 
     async def _async_apply_after_reach(self, room: RoomConfig, runtime: RoomRuntime) -> None:
-        all_climates = {
-            entity_id
-            for entity_id in merge_categories(
-                room.heat_category_1, room.heat_category_2, room.heat_category_3, 3
-            )
-            + merge_categories(room.cool_category_1, room.cool_category_2, room.cool_category_3, 3)
-            if entity_id.startswith("climate.")
-        }
-
-        for climate_entity in all_climates:
-            if climate_entity in room.shared_climates:
-                continue
+        for climate_entity in room.after_reach_climates:
             if await self._async_call_service_entity(climate_entity, "climate", "turn_off"):
                 self._log_room_action(
                     runtime,
@@ -935,47 +1062,59 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     reason="after_reach_target",
                 )
 
-    async def _async_apply_shared(self, demands: dict[str, list[tuple[str, str, float]]]) -> dict[str, str]:
+    async def _async_apply_shared(
+        self,
+        demands: dict[str, list[tuple[str, str, float]]],
+        outdoor_temp: float | None,
+    ) -> dict[str, str]:
         strategy = self._opt(CONF_SHARED_ARBITRATION)
         priority_room = self._resolve_priority_room_id(self._opt(CONF_PRIORITY_ROOM))
-        outdoor_temp = self._read_outdoor_temp()
         winner_rooms: dict[str, str] = {}
+        use_priority = strategy == "priority_room" and priority_room
         climate_entities = (
             list(self._shared_map.keys())
-            if strategy == "priority_room" and priority_room
-            else list(demands.keys())
+            if use_priority
+            else [climate_entity for climate_entity, items in demands.items() if items]
         )
+        if not climate_entities:
+            return winner_rooms
+
+        # Strategy settings are the same for every shared climate this cycle.
+        control_type_opt = self._opt(CONF_TYPE)
+        if use_priority:
+            hold_extra = float(self._opt(CONF_HEAT_ONLY_SHARED_HOLD_EXTRA))
+            outdoor_below = float(self._opt(CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW))
+            decay_step = float(
+                self._opt(CONF_HOLD_OFFSET_DECAY_STEP)
+                or OPTIONS_DEFAULTS[CONF_HOLD_OFFSET_DECAY_STEP]
+            )
+        else:
+            step_offset = float(self._opt(CONF_STEP_OFFSET))
 
         for climate_entity in climate_entities:
             climate_demands = demands.get(climate_entity, [])
             involved_rooms = [
                 room_id
-                for room_id in self._shared_map.get(climate_entity, [])
-                if self._room_enabled(room_id)
-                and room_id in self._runtime
+                for room_id in self._shared_map.get(climate_entity, ())
+                if room_id in self._runtime
+                and self._runtime[room_id].enabled
                 and self._runtime[room_id].current_temp is not None
             ]
             if not involved_rooms:
                 _LOGGER.debug("Skip shared %s: all rooms disabled", climate_entity)
                 continue
 
-            if strategy == "priority_room" and priority_room:
+            if use_priority:
                 if priority_room not in involved_rooms:
                     continue
                 priority_runtime = self._runtime[priority_room]
                 if priority_runtime.current_temp is None:
                     continue
-                target = self._room_target(priority_room)
-                tolerance = self._room_tolerance(priority_room)
+                target = priority_runtime.target_temp
+                tolerance = priority_runtime.tolerance
                 diff_heat = target - priority_runtime.current_temp
                 diff_cool = priority_runtime.current_temp - target
                 heat_only_shared = self._is_heat_only_shared_climate(climate_entity, involved_rooms)
-                hold_extra = float(self._opt(CONF_HEAT_ONLY_SHARED_HOLD_EXTRA))
-                outdoor_below = float(self._opt(CONF_HEAT_ONLY_SHARED_HOLD_OUTDOOR_BELOW))
-                decay_step = float(
-                    self._opt(CONF_HOLD_OFFSET_DECAY_STEP)
-                    or OPTIONS_DEFAULTS[CONF_HOLD_OFFSET_DECAY_STEP]
-                )
                 apply_heat_only_extra = (
                     heat_only_shared
                     and outdoor_temp is not None
@@ -997,13 +1136,13 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if diff_heat > tolerance:
                     is_heating = True
                     offset = priority_runtime.current_offset
-                    control_type = self._opt(CONF_TYPE)
+                    control_type = control_type_opt
                     if apply_heat_only_extra:
                         offset = max(offset, hold_extra)
                 elif diff_cool > tolerance:
                     is_heating = False
                     offset = priority_runtime.current_offset
-                    control_type = self._opt(CONF_TYPE)
+                    control_type = control_type_opt
                     # If a heat-only floor had elevated hold setpoint, lower it smoothly
                     # during cooling demand so it does not fight room cooldown.
                     if apply_heat_only_extra:
@@ -1015,12 +1154,11 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     if apply_heat_only_extra:
                         any_shared_room_overheated = any(
                             (
-                                self._runtime[room_id].current_temp is not None
-                                and (self._runtime[room_id].current_temp - self._room_target(room_id))
-                                > self._room_tolerance(room_id)
+                                self._runtime[room_id].current_temp
+                                - self._runtime[room_id].target_temp
                             )
+                            > self._runtime[room_id].tolerance
                             for room_id in involved_rooms
-                            if room_id in self._runtime
                         )
                         if priority_runtime.current_temp > target or any_shared_room_overheated:
                             offset = max(0.0, current_extra - decay_step)
@@ -1041,14 +1179,19 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             elif strategy == "average_request":
                 if not climate_demands:
                     continue
-                heat = [d for d in climate_demands if d[1] == "heat"]
-                cool = [d for d in climate_demands if d[1] == "cool"]
-                if len(heat) >= len(cool):
-                    avg = sum(item[2] for item in heat) / max(len(heat), 1)
-                    selected = ("avg", "heat", avg)
+                heat_count = cool_count = 0
+                heat_sum = cool_sum = 0.0
+                for _room_id, direction, diff in climate_demands:
+                    if direction == "heat":
+                        heat_count += 1
+                        heat_sum += diff
+                    elif direction == "cool":
+                        cool_count += 1
+                        cool_sum += diff
+                if heat_count >= cool_count:
+                    selected = ("avg", "heat", heat_sum / max(heat_count, 1))
                 else:
-                    avg = sum(item[2] for item in cool) / max(len(cool), 1)
-                    selected = ("avg", "cool", avg)
+                    selected = ("avg", "cool", cool_sum / cool_count)
                 winner_rooms[climate_entity] = "average"
             else:
                 if not climate_demands:
@@ -1057,16 +1200,16 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 winner_rooms[climate_entity] = selected[0]
 
             is_heating = selected[1] == "heat"
-            target = max(self._room_target(room_id) for room_id in involved_rooms)
-            if not is_heating:
-                target = min(self._room_target(room_id) for room_id in involved_rooms)
+            # Room targets were resolved into runtime at the start of this cycle.
+            room_targets = [self._runtime[room_id].target_temp for room_id in involved_rooms]
+            target = max(room_targets) if is_heating else min(room_targets)
 
             await self._async_set_climate(
                 climate_entity,
                 target=target,
                 is_heating=is_heating,
-                control_type=self._opt(CONF_TYPE),
-                offset=float(self._opt(CONF_STEP_OFFSET)),
+                control_type=control_type_opt,
+                offset=step_offset,
                 force_heat_mode=self._is_heat_only_shared_climate(climate_entity, involved_rooms),
             )
         return winner_rooms
@@ -1126,8 +1269,11 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return result
 
         action_sent = False
-        hvac_modes = state.attributes.get("hvac_modes", [])
-        requested_hvac_mode = "heat" if force_heat_mode else mode_hvac(is_heating)
+        attributes = state.attributes
+        hvac_modes = attributes.get("hvac_modes", [])
+        requested_hvac_mode = (
+            _HEAT_HVAC_MODE if force_heat_mode or is_heating else _COOL_HVAC_MODE
+        )
         selected_hvac_mode: str | None = None
         if requested_hvac_mode in hvac_modes:
             selected_hvac_mode = requested_hvac_mode
@@ -1135,15 +1281,10 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             selected_hvac_mode = "auto"
 
         result["hvac_mode"] = selected_hvac_mode or requested_hvac_mode
+        hvac_mode_change: str | None = None
         if not skip_hvac:
             if selected_hvac_mode is not None and state.state != selected_hvac_mode:
-                await self.hass.services.async_call(
-                    "climate",
-                    "set_hvac_mode",
-                    {ATTR_ENTITY_ID: entity_id, "hvac_mode": selected_hvac_mode},
-                    blocking=False,
-                )
-                action_sent = True
+                hvac_mode_change = selected_hvac_mode
                 result["hvac_changed"] = True
             elif state.state == "off":
                 # Some radiator thermostats expose only auto/off. Wake them up from off.
@@ -1156,8 +1297,8 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 action_sent = True
                 result["hvac_changed"] = True
 
-        climate_min = state.attributes.get("min_temp")
-        climate_max = state.attributes.get("max_temp")
+        climate_min = attributes.get("min_temp")
+        climate_max = attributes.get("max_temp")
         setpoint = compute_setpoint(
             target=target,
             is_heating=is_heating,
@@ -1167,7 +1308,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             climate_max_temp=float(climate_max) if climate_max is not None else None,
         )
         result["setpoint"] = setpoint
-        current_setpoint = state.attributes.get("temperature")
+        current_setpoint = attributes.get("temperature")
         if current_setpoint is None:
             should_set_temp = True
         else:
@@ -1182,35 +1323,76 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             or state.state == selected_hvac_mode
             or (selected_hvac_mode == "auto" and state.state != "off")
         )
-        if hvac_already_ok and not should_set_temp:
+        nothing_to_do = hvac_already_ok and not should_set_temp
+        device_state = self._device_state[entity_id]
+        if nothing_to_do:
+            # The device confirmed the last command; only unconfirmed commands are
+            # held back by the resend dedupe below.
+            device_state.last_hvac_mode = None
+            device_state.last_setpoint = None
+            if action_sent:
+                self._cycle_needs_rerun = True
             result["active"] = True
             return result
 
-        if not self._can_act(entity_id):
+        if (
+            hvac_mode_change is None
+            and device_state.last_hvac_mode == result["hvac_mode"]
+            and device_state.last_setpoint == round(setpoint, 2)
+            and time.monotonic() - device_state.last_action_monotonic < COMMAND_RESEND_SECONDS
+        ):
+            # Same setpoint already sent and not reflected yet (e.g. the device rounds
+            # to its own step); wait before repeating it. A needed mode change, such
+            # as after a manual switch-off, always goes out.
+            self._cycle_needs_rerun = True
+            result["active"] = True
             return result
 
-        if should_set_temp:
+        can_act = self._can_act(device_state)
+        if should_set_temp and can_act:
+            service_data: dict[str, Any] = {ATTR_ENTITY_ID: entity_id, "temperature": setpoint}
+            if hvac_mode_change is not None:
+                # set_temperature accepts hvac_mode, so one call covers both changes.
+                service_data["hvac_mode"] = hvac_mode_change
             await self.hass.services.async_call(
                 "climate",
                 "set_temperature",
-                {ATTR_ENTITY_ID: entity_id, "temperature": setpoint},
+                service_data,
                 blocking=False,
             )
             action_sent = True
             result["temperature_changed"] = True
+        elif hvac_mode_change is not None:
+            await self.hass.services.async_call(
+                "climate",
+                "set_hvac_mode",
+                {ATTR_ENTITY_ID: entity_id, "hvac_mode": hvac_mode_change},
+                blocking=False,
+            )
+            action_sent = True
+
+        if action_sent:
+            self._cycle_needs_rerun = True
+
+        if not can_act:
+            return result
 
         if action_sent:
-            self._device_state[entity_id].last_action_time = dt_util.utcnow()
+            device_state.last_action_monotonic = time.monotonic()
+            device_state.last_hvac_mode = result["hvac_mode"]
+            device_state.last_setpoint = round(setpoint, 2)
             result["sent"] = True
             result["active"] = True
         return result
 
     async def _async_call_service_entity(self, entity_id: str, domain: str, service: str) -> bool:
-        if not self._can_act(entity_id):
-            return False
+        if domain == "climate" and service == "turn_off":
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state == "off":
+                return False
 
-        state = self.hass.states.get(entity_id)
-        if domain == "climate" and service == "turn_off" and state is not None and state.state == "off":
+        device_state = self._device_state[entity_id]
+        if not self._can_act(device_state):
             return False
 
         await self.hass.services.async_call(
@@ -1219,15 +1401,19 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             {ATTR_ENTITY_ID: entity_id},
             blocking=False,
         )
-        self._device_state[entity_id].last_action_time = dt_util.utcnow()
+        device_state.last_action_monotonic = time.monotonic()
+        device_state.last_hvac_mode = None
+        device_state.last_setpoint = None
+        self._cycle_needs_rerun = True
         return True
 
-    def _can_act(self, entity_id: str) -> bool:
-        state = self._device_state[entity_id]
+    def _can_act(self, device_state: DeviceActionState) -> bool:
         min_action = int(self._opt(CONF_MIN_ACTION_INTERVAL))
-        if state.last_action_time is None:
+        if time.monotonic() - device_state.last_action_monotonic >= min_action:
             return True
-        return (dt_util.utcnow() - state.last_action_time) >= timedelta(seconds=min_action)
+        # Deferred by the anti-flap interval; the next cycle has to retry.
+        self._cycle_needs_rerun = True
+        return False
 
     def _room_payload(
         self,
@@ -1256,28 +1442,37 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "active_devices": runtime.active_devices,
             "hold_is_heating": runtime.hold_is_heating,
             "action_log": runtime.action_log,
-            "heat_category_1": room.heat_category_1,
-            "heat_category_2": room.heat_category_2,
-            "heat_category_3": room.heat_category_3,
-            "cool_category_1": room.cool_category_1,
-            "cool_category_2": room.cool_category_2,
-            "cool_category_3": room.cool_category_3,
-            "weather_sensitive_climates": room.weather_sensitive_climates,
-            "heat_only_climates": room.heat_only_climates,
-            "dumb_devices": [
-                {
-                    "on_script": dumb.on_script,
-                    "off_script": dumb.off_script,
-                    "device_type": dumb.device_type,
-                    "participation": dumb.participation,
-                    "category": dumb.category,
-                    "manage_off_script": dumb.manage_off_script,
-                }
-                for dumb in room.dumb_devices
-            ],
-            "shared_climates": room.shared_climates,
+            **self._room_static_payload(room),
         }
 
+    def _room_static_payload(self, room: RoomConfig) -> dict[str, Any]:
+        """Return the configuration part of a room payload, built once per load."""
+        payload = self._room_static_payloads.get(room.room_id)
+        if payload is None:
+            payload = self._room_static_payloads[room.room_id] = {
+                "heat_category_1": room.heat_category_1,
+                "heat_category_2": room.heat_category_2,
+                "heat_category_3": room.heat_category_3,
+                "cool_category_1": room.cool_category_1,
+                "cool_category_2": room.cool_category_2,
+                "cool_category_3": room.cool_category_3,
+                "weather_sensitive_climates": room.weather_sensitive_climates,
+                "heat_only_climates": room.heat_only_climates,
+                "dumb_devices": [
+                    {
+                        "on_script": dumb.on_script,
+                        "off_script": dumb.off_script,
+                        "device_type": dumb.device_type,
+                        "participation": dumb.participation,
+                        "category": dumb.category,
+                        "manage_off_script": dumb.manage_off_script,
+                    }
+                    for dumb in room.dumb_devices
+                ],
+                "shared_climates": room.shared_climates,
+            }
+        return payload
+
     @property
     def room_ids(self) -> list[str]:
         """Expose room ids for entity platforms."""
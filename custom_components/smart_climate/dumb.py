@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import Any
 
+try:
+    from homeassistant.helpers.json import json_loads
+except ImportError:  # pragma: no cover - fallback for lightweight test stubs
+    from json import loads as json_loads
+
 from .const import (
     DUMB_DEFAULT_CATEGORY,
     DUMB_DEVICE_COOL,
@@ -12,58 +17,77 @@ from .const import (
     DUMB_PARTICIPATION_ALWAYS,
     DUMB_PARTICIPATION_OFF,
     DUMB_PARTICIPATION_UNTIL_TARGET,
+    TRUTHY_STRINGS,
+)
+
+_ALLOWED_DEVICE_TYPES = frozenset((DUMB_DEVICE_HEAT, DUMB_DEVICE_COOL))
+_ALLOWED_PARTICIPATION = frozenset(
+    (
+        DUMB_PARTICIPATION_OFF,
+        DUMB_PARTICIPATION_ALWAYS,
+        DUMB_PARTICIPATION_UNTIL_TARGET,
+    )
 )
 
 
 def parse_dumb_devices_json(raw: str) -> list[dict[str, Any]]:
-    """Parse and validate dumb devices JSON from config flow."""
+    """Parse and validate dumb devices JSON from config flow.
+
+    Raises ValueError (including JSON decode errors) for invalid input.
+    """
     if not raw.strip():
         return []
 
-    value = json.loads(raw)
+    # The result ends up in entry data, so hand out copies of the cached devices.
+    return [dict(device) for device in _parse_dumb_devices_cached(raw)]
+
+
+@lru_cache(maxsize=32)
+def _parse_dumb_devices_cached(raw: str) -> tuple[dict[str, Any], ...]:
+    """Parse a dumb devices payload; resubmitted room forms reuse the result."""
+    value = json_loads(raw)
     if not isinstance(value, list):
         raise ValueError("dumb devices must be a list")
 
-    parsed: list[dict[str, Any]] = []
-    allowed_types = {DUMB_DEVICE_HEAT, DUMB_DEVICE_COOL}
-    allowed_participation = {
-        DUMB_PARTICIPATION_OFF,
-        DUMB_PARTICIPATION_ALWAYS,
-        DUMB_PARTICIPATION_UNTIL_TARGET,
+    return tuple(_parse_dumb_device(item) for item in value)
+
+
+def _parse_dumb_device(item: Any) -> dict[str, Any]:
+    """Validate one dumb device entry and return its normalized form."""
+    if not isinstance(item, dict):
+        raise ValueError("dumb device entry must be an object")
+    on_script = item.get("on_script")
+    off_script = item.get("off_script")
+    device_type = item.get("device_type")
+    participation = item.get("participation")
+    category = item.get("category", DUMB_DEFAULT_CATEGORY)
+    manage_off_script_raw = item.get("manage_off_script", True)
+    if not on_script or not off_script:
+        raise ValueError("dumb device requires on_script and off_script")
+    if not (
+        isinstance(on_script, str)
+        and isinstance(off_script, str)
+        and on_script[:7] == "script."
+        and off_script[:7] == "script."
+    ):
+        raise ValueError("dumb scripts must be script.* entities")
+    if not isinstance(device_type, str) or device_type not in _ALLOWED_DEVICE_TYPES:
+        raise ValueError("dumb device_type must be heat or cool")
+    if not isinstance(participation, str) or participation not in _ALLOWED_PARTICIPATION:
+        raise ValueError("invalid dumb participation")
+    if not isinstance(category, int) or category not in (1, 2, 3):
+        raise ValueError("dumb category must be 1, 2 or 3")
+    if isinstance(manage_off_script_raw, bool):
+        manage_off_script = manage_off_script_raw
+    elif isinstance(manage_off_script_raw, str):
+        manage_off_script = manage_off_script_raw.strip().lower() in TRUTHY_STRINGS
+    else:
+        manage_off_script = bool(manage_off_script_raw)
+    return {
+        "on_script": on_script,
+        "off_script": off_script,
+        "device_type": device_type,
+        "participation": participation,
+        "category": category,
+        "manage_off_script": manage_off_script,
     }
-    for item in value:
-        if not isinstance(item, dict):
-            raise ValueError("dumb device entry must be an object")
-        on_script = item.get("on_script")
-        off_script = item.get("off_script")
-        device_type = item.get("device_type")
-        participation = item.get("participation")
-        category = item.get("category", DUMB_DEFAULT_CATEGORY)
-        manage_off_script_raw = item.get("manage_off_script", True)
-        if not on_script or not off_script:
-            raise ValueError("dumb device requires on_script and off_script")
-        if not str(on_script).startswith("script.") or not str(off_script).startswith("script."):
-            raise ValueError("dumb scripts must be script.* entities")
-        if device_type not in allowed_types:
-            raise ValueError("dumb device_type must be heat or cool")
-        if participation not in allowed_participation:
-            raise ValueError("invalid dumb participation")
-        if not isinstance(category, int) or category not in (1, 2, 3):
-            raise ValueError("dumb category must be 1, 2 or 3")
-        if isinstance(manage_off_script_raw, bool):
-            manage_off_script = manage_off_script_raw
-        elif isinstance(manage_off_script_raw, str):
-            manage_off_script = manage_off_script_raw.strip().lower() in ("1", "true", "on", "yes")
-        else:
-            manage_off_script = bool(manage_off_script_raw)
-        parsed.append(
-            {
-                "on_script": str(on_script),
-                "off_script": str(off_script),
-                "device_type": str(device_type),
-                "participation": str(participation),
-                "category": category,
-                "manage_off_script": manage_off_script,
-            }
-        )
-    return parsed
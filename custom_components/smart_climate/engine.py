@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from statistics import median
 
@@ -137,10 +138,10 @@ def merge_categories(
 
 
 def filter_weather_sensitive(
-    entity_ids: list[str],
-    weather_sensitive_climates: set[str],
+    entity_ids: Sequence[str],
+    weather_sensitive_climates: Collection[str],
     is_outdoor_allowed: bool,
-) -> list[str]:
+) -> Sequence[str]:
     """Filter out weather-sensitive climate devices when outdoor policy blocks them."""
     if is_outdoor_allowed:
         return entity_ids
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -9,7 +10,7 @@ from typing import Any
 from .const import PHASE_IDLE
 
 
-@dataclass
+@dataclass(slots=True)
 class DumbDeviceConfig:
     """Configuration for a script-controlled device."""
 
@@ -21,7 +22,7 @@ class DumbDeviceConfig:
     manage_off_script: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomConfig:
     """Room static configuration."""
 
@@ -38,9 +39,59 @@ class RoomConfig:
     dumb_devices: list[DumbDeviceConfig] = field(default_factory=list)
     shared_climates: list[str] = field(default_factory=list)
     heat_only_climates: list[str] = field(default_factory=list)
+    # Derived lookups, built once per configuration load instead of per cycle.
+    heat_entities: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    cool_entities: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    room_climates: frozenset[str] = field(init=False, repr=False, compare=False)
+    shared_climate_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    weather_sensitive_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    # (is_heating, category) -> (non-shared climates, scripts) switched on for it.
+    category_actions: dict[tuple[bool, int], tuple[tuple[str, ...], tuple[str, ...]]] = field(
+        init=False, repr=False, compare=False
+    )
+    after_reach_climates: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.heat_entities = tuple(
+            dict.fromkeys((*self.heat_category_1, *self.heat_category_2, *self.heat_category_3))
+        )
+        self.cool_entities = tuple(
+            dict.fromkeys((*self.cool_category_1, *self.cool_category_2, *self.cool_category_3))
+        )
+        climates = tuple(
+            dict.fromkeys(
+                entity_id
+                for entity_id in (*self.heat_entities, *self.cool_entities)
+                if entity_id.startswith("climate.")
+            )
+        )
+        shared_climate_set = frozenset(self.shared_climates)
+        self.room_climates = frozenset(climates)
+        self.shared_climate_set = shared_climate_set
+        self.weather_sensitive_set = frozenset(self.weather_sensitive_climates)
+        category_actions: dict[tuple[bool, int], tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        for is_heating, categories in (
+            (True, (self.heat_category_1, self.heat_category_2, self.heat_category_3)),
+            (False, (self.cool_category_1, self.cool_category_2, self.cool_category_3)),
+        ):
+            merged: dict[str, None] = {}
+            for category, entity_ids in enumerate(categories, start=1):
+                merged.update(dict.fromkeys(entity_ids))
+                category_actions[(is_heating, category)] = (
+                    tuple(
+                        entity_id
+                        for entity_id in merged
+                        if entity_id.startswith("climate.") and entity_id not in shared_climate_set
+                    ),
+                    tuple(entity_id for entity_id in merged if entity_id.startswith("script.")),
+                )
+        self.category_actions = category_actions
+        self.after_reach_climates = tuple(
+            entity_id for entity_id in climates if entity_id not in shared_climate_set
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class RoomRuntime:
     """Room mutable runtime state."""
 
@@ -50,7 +101,7 @@ class RoomRuntime:
     tolerance: float = 0.3
     phase: str = PHASE_IDLE
     current_offset: float = 0.0
-    boost_started_at: datetime | None = None
+    boost_started_monotonic: float | None = None
     last_reach_time: datetime | None = None
     last_temp_sample: float | None = None
     active_category_heat: int = 0
@@ -62,8 +113,11 @@ class RoomRuntime:
     boost_elapsed_seconds: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceActionState:
     """Per-device anti-flapping state."""
 
-    last_action_time: datetime | None = None
+    # time.monotonic() of the last command; -inf means no command sent yet.
+    last_action_monotonic: float = -math.inf
+    last_hvac_mode: str | None = None
+    last_setpoint: float | None = None
@@ -0,0 +1,169 @@
+"""Lightweight Home Assistant and voluptuous stubs for running tests without HA installed."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import re
+import sys
+import types
+from types import SimpleNamespace
+
+
+def _install_homeassistant_stubs() -> None:
+    ha = types.ModuleType("homeassistant")
+    sys.modules["homeassistant"] = ha
+
+    config_entries = types.ModuleType("homeassistant.config_entries")
+
+    class _FlowHandler:
+        def async_show_form(self, *, step_id, data_schema=None, errors=None):
+            return {"type": "form", "step_id": step_id, "data_schema": data_schema, "errors": errors}
+
+        def async_show_menu(self, *, step_id, menu_options):
+            return {"type": "menu", "step_id": step_id, "menu_options": menu_options}
+
+        def async_create_entry(self, *, title, data):
+            return {"type": "create_entry", "title": title, "data": data}
+
+        def async_abort(self, *, reason):
+            return {"type": "abort", "reason": reason}
+
+    class _ConfigFlow(_FlowHandler):
+        def __init_subclass__(cls, domain=None, **kwargs) -> None:
+            super().__init_subclass__(**kwargs)
+
+        def _async_current_entries(self):
+            return []
+
+    config_entries.ConfigEntry = object
+    config_entries.ConfigFlow = _ConfigFlow
+    config_entries.ConfigFlowResult = dict
+    config_entries.OptionsFlow = _FlowHandler
+    config_entries.callback = lambda f: f
+    ha.config_entries = config_entries
+    sys.modules["homeassistant.config_entries"] = config_entries
+
+    const = types.ModuleType("homeassistant.const")
+    const.ATTR_ENTITY_ID = "entity_id"
+    const.STATE_UNAVAILABLE = "unavailable"
+    const.STATE_UNKNOWN = "unknown"
+    sys.modules["homeassistant.const"] = const
+
+    core = types.ModuleType("homeassistant.core")
+    core.Event = object
+    core.HassJobType = SimpleNamespace(Callback="callback")
+    core.HomeAssistant = object
+    core.callback = lambda f: f
+    sys.modules["homeassistant.core"] = core
+
+    helpers = types.ModuleType("homeassistant.helpers")
+    sys.modules["homeassistant.helpers"] = helpers
+    helpers_cv = types.ModuleType("homeassistant.helpers.config_validation")
+    helpers_cv.config_entry_only_config_schema = lambda _domain: {}
+    sys.modules["homeassistant.helpers.config_validation"] = helpers_cv
+
+    helpers_debounce = types.ModuleType("homeassistant.helpers.debounce")
+    helpers_debounce.Debouncer = object
+    sys.modules["homeassistant.helpers.debounce"] = helpers_debounce
+
+    helpers_event = types.ModuleType("homeassistant.helpers.event")
+    helpers_event.async_track_state_change_event = lambda *_args, **_kwargs: (lambda: None)
+    sys.modules["homeassistant.helpers.event"] = helpers_event
+
+    helpers_json = types.ModuleType("homeassistant.helpers.json")
+    helpers_json.json_dumps = json.dumps
+    helpers_json.json_loads = json.loads
+    sys.modules["homeassistant.helpers.json"] = helpers_json
+
+    helpers_selector = types.ModuleType("homeassistant.helpers.selector")
+
+    class _SelectorConfig(dict):
+        def __init__(self, **kwargs) -> None:
+            super().__init__(kwargs)
+
+    class _Selector:
+        def __init__(self, config=None) -> None:
+            self.config = config
+
+    for name in ("Entity", "Number", "Select", "Text"):
+        setattr(helpers_selector, f"{name}Selector", type(f"{name}Selector", (_Selector,), {}))
+        setattr(
+            helpers_selector,
+            f"{name}SelectorConfig",
+            type(f"{name}SelectorConfig", (_SelectorConfig,), {}),
+        )
+    helpers_selector.NumberSelectorMode = SimpleNamespace(BOX="box", SLIDER="slider")
+    sys.modules["homeassistant.helpers.selector"] = helpers_selector
+
+    helpers_update = types.ModuleType("homeassistant.helpers.update_coordinator")
+    helpers_update.UpdateFailed = Exception
+
+    class _DataUpdateCoordinator:
+        def __init__(self, *_args, **_kwargs) -> None:
+            pass
+
+        def __class_getitem__(cls, _item):
+            return cls
+
+    helpers_update.DataUpdateCoordinator = _DataUpdateCoordinator
+    sys.modules["homeassistant.helpers.update_coordinator"] = helpers_update
+
+    util = types.ModuleType("homeassistant.util")
+    util.slugify = lambda value: re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+    sys.modules["homeassistant.util"] = util
+
+    util_dt = types.ModuleType("homeassistant.util.dt")
+    import datetime as _dt
+
+    util_dt.utcnow = _dt.datetime.utcnow
+    util.dt = util_dt
+    sys.modules["homeassistant.util.dt"] = util_dt
+
+
+def _install_voluptuous_stub() -> None:
+    vol = types.ModuleType("voluptuous")
+    undefined = object()
+
+    class Invalid(Exception):
+        pass
+
+    class Marker:
+        def __init__(self, schema, default=undefined) -> None:
+            self.schema = schema
+            self.default = default
+
+    class Required(Marker):
+        pass
+
+    class Optional(Marker):
+        pass
+
+    class Schema:
+        def __init__(self, schema) -> None:
+            self.schema = schema
+
+        def __call__(self, data):
+            result = dict(data)
+            for marker in self.schema:
+                if marker.schema in result:
+                    continue
+                if marker.default is not undefined:
+                    result[marker.schema] = marker.default
+                elif isinstance(marker, Required):
+                    raise Invalid(f"required key not provided: {marker.schema}")
+            return result
+
+    vol.Invalid = Invalid
+    vol.Marker = Marker
+    vol.Optional = Optional
+    vol.Required = Required
+    vol.Schema = Schema
+    sys.modules["voluptuous"] = vol
+
+
+if "homeassistant" not in sys.modules:
+    _install_homeassistant_stubs()
+
+if "voluptuous" not in sys.modules and importlib.util.find_spec("voluptuous") is None:
+    _install_voluptuous_stub()
@@ -0,0 +1,180 @@
+"""Smoke tests for the config and options flow steps."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import MappingProxyType, SimpleNamespace
+
+from custom_components.smart_climate import config_flow
+from custom_components.smart_climate.const import (
+    CONF_AC_MISSING_OUTDOOR_POLICY,
+    CONF_AGGREGATION,
+    CONF_MODE,
+    CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
+    CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
+    CONF_OUTDOOR_SOURCE_TYPE,
+    CONF_PER_ROOM_TARGETS,
+    CONF_PRIORITY_ROOM,
+    CONF_ROOM_DUMB_DEVICES,
+    CONF_ROOM_ENABLED,
+    CONF_ROOM_ID,
+    CONF_ROOM_NAME,
+    CONF_ROOM_TEMP_SENSORS,
+    CONF_ROOMS,
+    CONF_T_TIME,
+    CONF_TOLERANCE,
+    DEFAULT_MODE,
+    DEFAULT_TOLERANCE,
+    OUTDOOR_POLICY_BLOCK,
+    OUTDOOR_SOURCE_NONE,
+)
+
+_DUMB_DEVICES_JSON = json.dumps(
+    [
+        {
+            "on_script": "script.heater_on",
+            "off_script": "script.heater_off",
+            "device_type": "heat",
+            "participation": "always_on",
+        }
+    ]
+)
+
+
+def _entry(data: dict, options: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        data=MappingProxyType(data),
+        options=MappingProxyType(options),
+        entry_id="entry",
+    )
+
+
+def _stored_rooms() -> list[dict]:
+    return [
+        {
+            CONF_ROOM_ID: "kitchen",
+            CONF_ROOM_NAME: "Kitchen",
+            CONF_ROOM_TEMP_SENSORS: ["sensor.kitchen"],
+            CONF_ROOM_DUMB_DEVICES: json.loads(_DUMB_DEVICES_JSON),
+        },
+        {
+            CONF_ROOM_ID: "hall",
+            CONF_ROOM_NAME: "Hall",
+            CONF_ROOM_TEMP_SENSORS: ["sensor.hall"],
+            CONF_ROOM_DUMB_DEVICES: [],
+        },
+    ]
+
+
+def test_config_flow_creates_entry_with_rooms() -> None:
+    flow = config_flow.SmartClimateConfigFlow()
+
+    async def _run() -> dict:
+        result = await flow.async_step_user()
+        assert result["step_id"] == "user"
+        result = await flow.async_step_user(
+            {
+                CONF_OUTDOOR_SOURCE_TYPE: OUTDOOR_SOURCE_NONE,
+                CONF_AC_MISSING_OUTDOOR_POLICY: OUTDOOR_POLICY_BLOCK,
+                CONF_AGGREGATION: "average",
+            }
+        )
+        assert result["step_id"] == "room"
+        result = await flow.async_step_room(
+            {
+                CONF_ROOM_NAME: "Kitchen",
+                CONF_ROOM_TEMP_SENSORS: ["sensor.kitchen"],
+                "dumb_devices_json": _DUMB_DEVICES_JSON,
+                "add_another_room": True,
+            }
+        )
+        assert result["step_id"] == "room"
+        result = await flow.async_step_room(
+            {CONF_ROOM_NAME: "Kitchen", CONF_ROOM_TEMP_SENSORS: ["sensor.other"]}
+        )
+        assert result["errors"] == {CONF_ROOM_NAME: "duplicate_room"}
+        result = await flow.async_step_room(
+            {CONF_ROOM_NAME: "Bad", CONF_ROOM_TEMP_SENSORS: ["sensor.bad"], "dumb_devices_json": "[1"}
+        )
+        assert result["errors"] == {"base": "invalid_room_json"}
+        return await flow.async_step_room({CONF_ROOM_NAME: "Hall", CONF_ROOM_TEMP_SENSORS: ["sensor.hall"]})
+
+    result = asyncio.run(_run())
+
+    assert result["type"] == "create_entry"
+    data = result["data"]
+    assert [room[CONF_ROOM_ID] for room in data[CONF_ROOMS]] == ["kitchen", "hall"]
+    assert data[CONF_ROOMS][0][CONF_ROOM_DUMB_DEVICES][0]["category"] == 2
+    assert data[CONF_MODE] == DEFAULT_MODE
+
+
+def test_options_settings_casts_values_and_drops_unknown_rooms() -> None:
+    options = {CONF_PER_ROOM_TARGETS: {"hall": 21.0, "gone": 19.0}, CONF_PRIORITY_ROOM: "gone"}
+    entry = _entry({CONF_ROOMS: _stored_rooms()}, options)
+    flow = config_flow.SmartClimateOptionsFlow(entry)
+
+    form = asyncio.run(flow.async_step_settings())
+    submitted = form["data_schema"]({})
+    assert submitted[CONF_TOLERANCE] == DEFAULT_TOLERANCE
+    submitted[CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE] = 30
+    submitted[CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE] = 10
+    submitted[CONF_T_TIME] = 5.0
+
+    result = asyncio.run(flow.async_step_settings(submitted))
+
+    assert result["type"] == "create_entry"
+    saved = result["data"]
+    assert saved[CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE] == 10.0
+    assert saved[CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE] == 30.0
+    assert isinstance(saved[CONF_T_TIME], int)
+    assert saved[CONF_PER_ROOM_TARGETS] == {"hall": 21.0}
+    assert saved[CONF_PRIORITY_ROOM] == ""
+    assert saved[CONF_ROOM_ENABLED] == {}
+    # The stored entry options are not modified in place.
+    assert entry.options[CONF_PER_ROOM_TARGETS] == {"hall": 21.0, "gone": 19.0}
+
+
+def test_options_add_edit_and_delete_room() -> None:
+    entry = _entry({CONF_ROOMS: _stored_rooms()}, {CONF_PER_ROOM_TARGETS: {"hall": 21.0}})
+
+    flow = config_flow.SmartClimateOptionsFlow(entry)
+    menu = asyncio.run(flow.async_step_init())
+    assert "edit_room_select" in menu["menu_options"]
+    result = asyncio.run(
+        flow.async_step_add_room({CONF_ROOM_NAME: "Hall", CONF_ROOM_TEMP_SENSORS: ["sensor.x"]})
+    )
+    assert result["errors"] == {CONF_ROOM_NAME: "duplicate_room"}
+    result = asyncio.run(
+        flow.async_step_add_room(
+            {CONF_ROOM_NAME: "Bath", CONF_ROOM_TEMP_SENSORS: ["sensor.bath"], "dumb_devices_json": " "}
+        )
+    )
+    assert [room[CONF_ROOM_ID] for room in result["data"][CONF_ROOMS]] == ["kitchen", "hall", "bath"]
+
+    flow = config_flow.SmartClimateOptionsFlow(entry)
+    form = asyncio.run(flow.async_step_edit_room_select({"room_id": "kitchen"}))
+    assert form["step_id"] == "edit_room"
+    shown = form["data_schema"]({})
+    assert shown[CONF_ROOM_NAME] == "Kitchen"
+    assert json.loads(shown["dumb_devices_json"])[0]["on_script"] == "script.heater_on"
+    shown[CONF_ROOM_TEMP_SENSORS] = ["sensor.kitchen_2"]
+    result = asyncio.run(flow.async_step_edit_room(shown))
+    rooms = result["data"][CONF_ROOMS]
+    assert rooms[0][CONF_ROOM_TEMP_SENSORS] == ["sensor.kitchen_2"]
+    assert rooms[1][CONF_ROOM_ID] == "hall"
+
+    flow = config_flow.SmartClimateOptionsFlow(entry)
+    asyncio.run(flow.async_step_delete_room_select({"room_id": "hall"}))
+    result = asyncio.run(flow.async_step_delete_room_confirm({"confirm_delete": True}))
+    assert [room[CONF_ROOM_ID] for room in result["data"][CONF_ROOMS]] == ["kitchen"]
+    assert result["data"][CONF_PER_ROOM_TARGETS] == {}
+
+    flow = config_flow.SmartClimateOptionsFlow(entry)
+    asyncio.run(flow.async_step_delete_room_select({"room_id": "hall"}))
+    result = asyncio.run(flow.async_step_delete_room_confirm({"confirm_delete": False}))
+    assert result == {"type": "abort", "reason": "delete_cancelled"}
+
+    # The stored entry is left untouched by every step.
+    assert [room[CONF_ROOM_ID] for room in entry.data[CONF_ROOMS]] == ["kitchen", "hall"]
+    assert entry.data[CONF_ROOMS][0][CONF_ROOM_TEMP_SENSORS] == ["sensor.kitchen"]
@@ -3,66 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import sys
-import types
+import time
+from collections import defaultdict
 from types import MethodType, SimpleNamespace
 
-if "homeassistant" not in sys.modules:
-    ha = types.ModuleType("homeassistant")
-    sys.modules["homeassistant"] = ha
-
-    config_entries = types.ModuleType("homeassistant.config_entries")
-    config_entries.ConfigEntry = object
-    sys.modules["homeassistant.config_entries"] = config_entries
-
-    const = types.ModuleType("homeassistant.const")
-    const.ATTR_ENTITY_ID = "entity_id"
-    const.STATE_UNAVAILABLE = "unavailable"
-    const.STATE_UNKNOWN = "unknown"
-    sys.modules["homeassistant.const"] = const
-
-    core = types.ModuleType("homeassistant.core")
-    core.Event = object
-    core.HomeAssistant = object
-    core.callback = lambda f: f
-    sys.modules["homeassistant.core"] = core
-
-    helpers = types.ModuleType("homeassistant.helpers")
-    sys.modules["homeassistant.helpers"] = helpers
-    helpers_cv = types.ModuleType("homeassistant.helpers.config_validation")
-    helpers_cv.config_entry_only_config_schema = lambda _domain: {}
-    sys.modules["homeassistant.helpers.config_validation"] = helpers_cv
-
-    helpers_debounce = types.ModuleType("homeassistant.helpers.debounce")
-    helpers_debounce.Debouncer = object
-    sys.modules["homeassistant.helpers.debounce"] = helpers_debounce
-
-    helpers_event = types.ModuleType("homeassistant.helpers.event")
-    helpers_event.async_track_state_change_event = lambda *_args, **_kwargs: (lambda: None)
-    sys.modules["homeassistant.helpers.event"] = helpers_event
-
-    helpers_update = types.ModuleType("homeassistant.helpers.update_coordinator")
-    helpers_update.UpdateFailed = Exception
-
-    class _DataUpdateCoordinator:
-        def __init__(self, *_args, **_kwargs) -> None:
-            pass
-
-        def __class_getitem__(cls, _item):
-            return cls
-
-    helpers_update.DataUpdateCoordinator = _DataUpdateCoordinator
-    sys.modules["homeassistant.helpers.update_coordinator"] = helpers_update
-
-    util = types.ModuleType("homeassistant.util")
-    sys.modules["homeassistant.util"] = util
-
-    util_dt = types.ModuleType("homeassistant.util.dt")
-    import datetime as _dt
-
-    util_dt.utcnow = _dt.datetime.utcnow
-    sys.modules["homeassistant.util.dt"] = util_dt
-
 import custom_components.smart_climate.coordinator as coordinator_module
 from custom_components.smart_climate.const import (
     CONF_AC_MISSING_OUTDOOR_POLICY,
@@ -80,9 +24,12 @@ from custom_components.smart_climate.const import (
     CONF_HEAT_OUTDOOR_TARGET_DELTA,
     CONF_HOLD_OFFSET_DECAY_STEP,
     CONF_MAX_OFFSET,
+    CONF_MIN_ACTION_INTERVAL,
     CONF_MODE,
     CONF_OUTDOOR_MAX_FOR_WEATHER_SENSITIVE,
     CONF_OUTDOOR_MIN_FOR_WEATHER_SENSITIVE,
+    CONF_OUTDOOR_SOURCE_TYPE,
+    CONF_OUTDOOR_WEATHER,
     CONF_PRIORITY_ROOM,
     CONF_STEP_OFFSET,
     CONF_T_TIME,
@@ -90,13 +37,20 @@ from custom_components.smart_climate.const import (
     MODE_OFF,
     MODE_PER_ROOM,
     OUTDOOR_POLICY_ALLOW,
+    OUTDOOR_SOURCE_WEATHER,
+    PHASE_BOOST,
     PHASE_HOLD,
     TYPE_EXTREME,
     TYPE_FAST,
     TYPE_NORMAL,
 )
 from custom_components.smart_climate.coordinator import SmartClimateCoordinator
-from custom_components.smart_climate.models import DumbDeviceConfig, RoomConfig, RoomRuntime
+from custom_components.smart_climate.models import (
+    DeviceActionState,
+    DumbDeviceConfig,
+    RoomConfig,
+    RoomRuntime,
+)
 
 
 def _make_coordinator_with_call_log(call_log: list[tuple[str, str, str]]) -> SmartClimateCoordinator:
@@ -301,7 +255,7 @@ def test_shared_priority_room_reduces_setpoint_to_target_when_no_demand() -> Non
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({}))
+    winners = asyncio.run(coordinator._async_apply_shared({}, 20.0))
 
     assert calls
     call = calls[0]
@@ -378,7 +332,7 @@ def test_shared_priority_room_heat_only_does_not_drop_to_target_when_no_demand()
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({}))
+    winners = asyncio.run(coordinator._async_apply_shared({}, 0.0))
 
     assert calls
     call = calls[0]
@@ -453,7 +407,7 @@ def test_shared_priority_room_heat_only_applies_plus_n_during_heating() -> None:
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({climate_id: [(room_id, "heat", 1.5)]}))
+    winners = asyncio.run(coordinator._async_apply_shared({climate_id: [(room_id, "heat", 1.5)]}, 0.0))
 
     assert calls
     call = calls[0]
@@ -527,7 +481,7 @@ def test_shared_priority_room_heat_only_during_cooling_softly_reduces_extra() ->
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({climate_id: [(room_id, "cool", 0.8)]}))
+    winners = asyncio.run(coordinator._async_apply_shared({climate_id: [(room_id, "cool", 0.8)]}, 0.0))
 
     assert calls
     call = calls[0]
@@ -601,7 +555,7 @@ def test_shared_priority_room_heat_only_above_target_softly_reduces_floor_setpoi
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({}))
+    winners = asyncio.run(coordinator._async_apply_shared({}, 0.0))
 
     assert calls
     call = calls[0]
@@ -687,7 +641,7 @@ def test_shared_priority_room_heat_only_reduces_floor_when_other_shared_room_ove
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({}))
+    winners = asyncio.run(coordinator._async_apply_shared({}, 0.0))
 
     assert calls
     call = calls[0]
@@ -792,7 +746,7 @@ def test_shared_heat_only_climate_forces_heat_mode() -> None:
 
     coordinator._async_set_climate = MethodType(_fake_set_climate, coordinator)  # type: ignore[attr-defined]
 
-    winners = asyncio.run(coordinator._async_apply_shared({climate_id: [(room_id, "cool", 2.0)]}))
+    winners = asyncio.run(coordinator._async_apply_shared({climate_id: [(room_id, "cool", 2.0)]}, 20.0))
 
     assert winners == {climate_id: room_id}
     assert calls and calls[0]["force_heat_mode"] is True
@@ -890,6 +844,7 @@ def test_mode_off_does_not_touch_devices_and_skips_shared_arbitration() -> None:
     )
 
     coordinator._rooms = {room_id: room}  # type: ignore[attr-defined]
+    coordinator._room_static_payloads = {}  # type: ignore[attr-defined]
     coordinator._runtime = {room_id: RoomRuntime(enabled=True)}  # type: ignore[attr-defined]
     coordinator._shared_map = {"climate.shared_floor": [room_id]}  # type: ignore[attr-defined]
     coordinator._managed_dumb_on_scripts = {"script.fireplace_on"}  # type: ignore[attr-defined]
@@ -904,7 +859,7 @@ def test_mode_off_does_not_touch_devices_and_skips_shared_arbitration() -> None:
         calls.append((entity_id, domain, service))
         return True
 
-    async def _fail_shared(self, demands):
+    async def _fail_shared(self, demands, outdoor_temp):
         raise AssertionError("shared arbitration must not run in MODE_OFF")
 
     coordinator._async_call_service_entity = MethodType(_fake_call, coordinator)  # type: ignore[attr-defined]
@@ -928,6 +883,7 @@ def test_hold_phase_keeps_climate_active_on_target() -> None:
         heat_category_1=["climate.radiator"],
     )
     coordinator._rooms = {room_id: room}  # type: ignore[attr-defined]
+    coordinator._room_static_payloads = {}  # type: ignore[attr-defined]
     coordinator._runtime = {  # type: ignore[attr-defined]
         room_id: RoomRuntime(
             enabled=True,
@@ -983,7 +939,7 @@ def test_hold_phase_keeps_climate_active_on_target() -> None:
         )
         return ["climate.radiator"]
 
-    async def _fake_apply_shared(self, demands):
+    async def _fake_apply_shared(self, demands, outdoor_temp):
         return {}
 
     coordinator._async_apply_room_actions = MethodType(_fake_apply_room_actions, coordinator)  # type: ignore[attr-defined]
@@ -1009,6 +965,7 @@ def test_direction_switch_hysteresis_delays_and_allows_heat_to_cool_switch() ->
         cool_category_1=["climate.ac"],
     )
     coordinator._rooms = {room_id: room}  # type: ignore[attr-defined]
+    coordinator._room_static_payloads = {}  # type: ignore[attr-defined]
     coordinator._shared_map = {}  # type: ignore[attr-defined]
     coordinator._managed_dumb_on_scripts = set()  # type: ignore[attr-defined]
     opts = {
@@ -1048,7 +1005,7 @@ def test_direction_switch_hysteresis_delays_and_allows_heat_to_cool_switch() ->
         calls.append({"is_heating": is_heating, "category": category})
         return ["climate.radiator" if is_heating else "climate.ac"]
 
-    async def _fake_apply_shared(self, demands):
+    async def _fake_apply_shared(self, demands, outdoor_temp):
         return {}
 
     coordinator._async_apply_room_actions = MethodType(_fake_apply_room_actions, coordinator)  # type: ignore[attr-defined]
@@ -1090,3 +1047,283 @@ def test_direction_switch_hysteresis_delays_and_allows_heat_to_cool_switch() ->
         assert calls and calls[-1]["is_heating"] is False
     finally:
         coordinator_module.next_phase_and_offset = original_next_phase_and_offset
+
+
+def test_state_listener_refreshes_only_when_tracked_value_changes() -> None:
+    coordinator = SmartClimateCoordinator.__new__(SmartClimateCoordinator)
+    coordinator.hass = None  # type: ignore[attr-defined]
+    coordinator._unsub_listeners = []  # type: ignore[attr-defined]
+    coordinator._rooms = {  # type: ignore[attr-defined]
+        "living": RoomConfig(room_id="living", name="Living", temp_sensors=["sensor.living"])
+    }
+    opts = {CONF_OUTDOOR_SOURCE_TYPE: OUTDOOR_SOURCE_WEATHER, CONF_OUTDOOR_WEATHER: "weather.home"}
+    coordinator._opt = MethodType(lambda self, key: opts.get(key), coordinator)  # type: ignore[attr-defined]
+    refreshes: list[str] = []
+    coordinator._debounced_refresh = SimpleNamespace(  # type: ignore[attr-defined]
+        async_schedule_call=lambda: refreshes.append("refresh")
+    )
+    tracked: dict[str, object] = {}
+
+    def _fake_track(_hass, entity_ids, action, job_type=None):
+        tracked["entity_ids"] = entity_ids
+        tracked["action"] = action
+        tracked["job_type"] = job_type
+        return lambda: None
+
+    original_track = coordinator_module.async_track_state_change_event
+    coordinator_module.async_track_state_change_event = _fake_track
+    try:
+        coordinator._setup_listeners()
+    finally:
+        coordinator_module.async_track_state_change_event = original_track
+
+    assert sorted(tracked["entity_ids"]) == ["sensor.living", "weather.home"]
+    assert tracked["job_type"] is coordinator_module.HassJobType.Callback
+    action = tracked["action"]
+
+    def _fire(entity_id: str, state: str, **attributes: object) -> None:
+        new_state = SimpleNamespace(state=state, attributes=attributes)
+        action(SimpleNamespace(data={"entity_id": entity_id, "new_state": new_state}))
+
+    # First event for an entity is compared against its old state.
+    action(
+        SimpleNamespace(
+            data={
+                "entity_id": "weather.home",
+                "old_state": SimpleNamespace(state="sunny", attributes={"temperature": 5.0}),
+                "new_state": SimpleNamespace(state="sunny", attributes={"temperature": 5.0, "humidity": 50}),
+            }
+        )
+    )
+    assert refreshes == []
+
+    _fire("sensor.living", "21.5")
+    _fire("sensor.living", "21.5", friendly_name="Living")
+    _fire("weather.home", "cloudy", temperature=5.0, humidity=70)
+    assert len(refreshes) == 1
+
+    _fire("sensor.living", "21.6")
+    _fire("weather.home", "cloudy", temperature=4.0)
+    assert len(refreshes) == 3
+
+
+def test_set_climate_sends_mode_and_temperature_in_one_call() -> None:
+    coordinator = SmartClimateCoordinator.__new__(SmartClimateCoordinator)
+    calls: list[tuple[str, str, dict[str, object]]] = []
+    states = {
+        "climate.off": SimpleNamespace(
+            state="off", attributes={"hvac_modes": ["heat", "off"], "temperature": 18.0}
+        ),
+        "climate.on_target": SimpleNamespace(
+            state="off", attributes={"hvac_modes": ["heat", "off"], "temperature": 22.0}
+        ),
+    }
+
+    async def _fake_async_call(domain, service, data, blocking=False):
+        calls.append((domain, service, data))
+
+    coordinator.hass = SimpleNamespace(  # type: ignore[attr-defined]
+        states=SimpleNamespace(get=states.get),
+        services=SimpleNamespace(async_call=_fake_async_call),
+    )
+    coordinator._device_state = defaultdict(DeviceActionState)  # type: ignore[attr-defined]
+    coordinator._opt = MethodType(lambda self, key: 0 if key == CONF_MIN_ACTION_INTERVAL else None, coordinator)  # type: ignore[attr-defined]
+
+    result = asyncio.run(
+        coordinator._async_set_climate(
+            "climate.off", target=22.0, is_heating=True, control_type=TYPE_NORMAL, offset=0.0
+        )
+    )
+    assert calls == [
+        (
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.off", "temperature": 22.0, "hvac_mode": "heat"},
+        )
+    ]
+    assert result["sent"] is True
+    assert result["hvac_changed"] is True
+    assert result["temperature_changed"] is True
+
+    # The device rounds the setpoint to its own step: the same command is not repeated.
+    states["climate.off"] = SimpleNamespace(
+        state="heat", attributes={"hvac_modes": ["heat", "off"], "temperature": 22.5}
+    )
+    calls.clear()
+    result = asyncio.run(
+        coordinator._async_set_climate(
+            "climate.off", target=22.0, is_heating=True, control_type=TYPE_NORMAL, offset=0.0
+        )
+    )
+    assert calls == []
+    assert result["active"] is True
+
+    asyncio.run(
+        coordinator._async_set_climate(
+            "climate.on_target", target=22.0, is_heating=True, control_type=TYPE_NORMAL, offset=0.0
+        )
+    )
+    assert calls == [
+        ("climate", "set_hvac_mode", {"entity_id": "climate.on_target", "hvac_mode": "heat"})
+    ]
+
+
+def test_set_climate_reasserts_mode_after_user_turns_confirmed_device_off() -> None:
+    coordinator = SmartClimateCoordinator.__new__(SmartClimateCoordinator)
+    calls: list[tuple[str, str, dict[str, object]]] = []
+    states = {
+        "climate.room": SimpleNamespace(
+            state="off", attributes={"hvac_modes": ["heat", "off"], "temperature": 18.0}
+        ),
+    }
+
+    async def _fake_async_call(domain, service, data, blocking=False):
+        calls.append((domain, service, data))
+
+    coordinator.hass = SimpleNamespace(  # type: ignore[attr-defined]
+        states=SimpleNamespace(get=states.get),
+        services=SimpleNamespace(async_call=_fake_async_call),
+    )
+    coordinator._device_state = defaultdict(DeviceActionState)  # type: ignore[attr-defined]
+    coordinator._opt = MethodType(lambda self, key: 0 if key == CONF_MIN_ACTION_INTERVAL else None, coordinator)  # type: ignore[attr-defined]
+
+    def _set() -> dict[str, object]:
+        return asyncio.run(
+            coordinator._async_set_climate(
+                "climate.room", target=22.0, is_heating=True, control_type=TYPE_NORMAL, offset=0.0
+            )
+        )
+
+    _set()
+    assert len(calls) == 1
+
+    # The device confirms the command, then the user switches it off by hand.
+    states["climate.room"] = SimpleNamespace(
+        state="heat", attributes={"hvac_modes": ["heat", "off"], "temperature": 22.0}
+    )
+    assert _set()["sent"] is False
+    states["climate.room"] = SimpleNamespace(
+        state="off", attributes={"hvac_modes": ["heat", "off"], "temperature": 22.0}
+    )
+    calls.clear()
+
+    result = _set()
+    assert calls == [("climate", "set_hvac_mode", {"entity_id": "climate.room", "hvac_mode": "heat"})]
+    assert result["sent"] is True
+
+
+def test_set_climate_reasserts_mode_after_user_turns_rounding_device_off() -> None:
+    coordinator = SmartClimateCoordinator.__new__(SmartClimateCoordinator)
+    calls: list[tuple[str, str, dict[str, object]]] = []
+    states = {
+        "climate.room": SimpleNamespace(
+            state="off", attributes={"hvac_modes": ["heat", "off"], "temperature": 18.0}
+        ),
+    }
+
+    async def _fake_async_call(domain, service, data, blocking=False):
+        calls.append((domain, service, data))
+
+    coordinator.hass = SimpleNamespace(  # type: ignore[attr-defined]
+        states=SimpleNamespace(get=states.get),
+        services=SimpleNamespace(async_call=_fake_async_call),
+    )
+    coordinator._device_state = defaultdict(DeviceActionState)  # type: ignore[attr-defined]
+    coordinator._opt = MethodType(lambda self, key: 0 if key == CONF_MIN_ACTION_INTERVAL else None, coordinator)  # type: ignore[attr-defined]
+
+    def _set() -> dict[str, object]:
+        return asyncio.run(
+            coordinator._async_set_climate(
+                "climate.room", target=22.3, is_heating=True, control_type=TYPE_NORMAL, offset=0.0
+            )
+        )
+
+    _set()
+    assert len(calls) == 1
+
+    # A 0.5 degree step device never confirms 22.3, then the user switches it off by hand.
+    states["climate.room"] = SimpleNamespace(
+        state="off", attributes={"hvac_modes": ["heat", "off"], "temperature": 22.5}
+    )
+    calls.clear()
+
+    result = _set()
+    assert calls == [
+        (
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.room", "temperature": 22.3, "hvac_mode": "heat"},
+        )
+    ]
+    assert result["sent"] is True
+    assert result["hvac_changed"] is True
+
+
+def test_turn_off_skips_climate_already_off_without_deferring() -> None:
+    coordinator = SmartClimateCoordinator.__new__(SmartClimateCoordinator)
+    calls: list[tuple[str, str]] = []
+    states = {"climate.off": SimpleNamespace(state="off", attributes={})}
+
+    async def _fake_async_call(domain, service, data, blocking=False):
+        calls.append((domain, service))
+
+    coordinator.hass = SimpleNamespace(  # type: ignore[attr-defined]
+        states=SimpleNamespace(get=states.get),
+        services=SimpleNamespace(async_call=_fake_async_call),
+    )
+    coordinator._device_state = defaultdict(DeviceActionState)  # type: ignore[attr-defined]
+    coordinator._device_state["climate.off"].last_action_monotonic = time.monotonic()
+    coordinator._opt = MethodType(lambda self, key: 60 if key == CONF_MIN_ACTION_INTERVAL else None, coordinator)  # type: ignore[attr-defined]
+    coordinator._cycle_needs_rerun = False  # type: ignore[attr-defined]
+
+    assert not asyncio.run(coordinator._async_call_service_entity("climate.off", "climate", "turn_off"))
+    assert calls == []
+    # Already off is settled, not deferred by the anti-flap interval.
+    assert coordinator._cycle_needs_rerun is False
+
+
+def test_update_skips_cycle_when_inputs_are_unchanged() -> None:
+    coordinator = SmartClimateCoordinator.__new__(SmartClimateCoordinator)
+    states = {"sensor.living": SimpleNamespace(state="21.0", attributes={})}
+    coordinator.hass = SimpleNamespace(states=SimpleNamespace(get=states.get))  # type: ignore[attr-defined]
+    coordinator.data = None  # type: ignore[attr-defined]
+    coordinator._lock = asyncio.Lock()  # type: ignore[attr-defined]
+    coordinator._runtime = {"living": RoomRuntime(phase=PHASE_HOLD)}  # type: ignore[attr-defined]
+    coordinator._managed_dumb_on_scripts = set()  # type: ignore[attr-defined]
+    coordinator._watched_entity_ids = ("sensor.living",)  # type: ignore[attr-defined]
+    coordinator._idle_cycle_key = None  # type: ignore[attr-defined]
+    coordinator._sync_update_interval = MethodType(lambda self: None, coordinator)  # type: ignore[attr-defined]
+    cycles: list[str] = []
+
+    async def _fake_cycle(self):
+        cycles.append("cycle")
+        return {"cycle": len(cycles)}
+
+    coordinator._async_run_control_cycle = MethodType(_fake_cycle, coordinator)  # type: ignore[attr-defined]
+
+    def _update() -> dict[str, object]:
+        coordinator.data = asyncio.run(coordinator._async_update_data())  # type: ignore[attr-defined]
+        return coordinator.data
+
+    _update()
+    assert _update() == {"cycle": 1}
+
+    states["sensor.living"] = SimpleNamespace(state="21.5", attributes={})
+    assert _update() == {"cycle": 2}
+
+    # A deferred or sent command always leads to a full follow-up cycle.
+    async def _deferring_cycle(self):
+        self._cycle_needs_rerun = True
+        cycles.append("cycle")
+        return {"cycle": len(cycles)}
+
+    coordinator._async_run_control_cycle = MethodType(_deferring_cycle, coordinator)  # type: ignore[attr-defined]
+    coordinator._idle_cycle_key = None  # type: ignore[attr-defined]
+    _update()
+    assert _update() == {"cycle": 4}
+
+    coordinator._runtime["living"].phase = PHASE_BOOST  # type: ignore[attr-defined]
+    coordinator._async_run_control_cycle = MethodType(_fake_cycle, coordinator)  # type: ignore[attr-defined]
+    _update()
+    assert _update() == {"cycle": 6}
+
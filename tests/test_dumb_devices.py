@@ -59,6 +59,24 @@ def test_parse_dumb_devices_rejects_invalid_category() -> None:
         assert "category must be 1, 2 or 3" in str(err)
 
 
+def test_parse_dumb_devices_rejects_non_string_scripts() -> None:
+    payload = """
+    [
+      {
+        "on_script": ["script.heater_on"],
+        "off_script": "script.heater_off",
+        "device_type": "heat",
+        "participation": "until_reach_target"
+      }
+    ]
+    """
+    try:
+        parse_dumb_devices_json(payload)
+        raise AssertionError("expected ValueError")
+    except ValueError as err:
+        assert "script.* entities" in str(err)
+
+
 def test_should_activate_dumb_device_by_category_and_type() -> None:
     assert should_activate_dumb_device(
         room_category=1,
@@ -112,3 +130,21 @@ def test_parse_dumb_devices_manage_off_script_flag() -> None:
     """
     parsed = parse_dumb_devices_json(payload)
     assert parsed[0]["manage_off_script"] is False
+
+
+def test_parse_dumb_devices_returns_independent_copies() -> None:
+    payload = """
+    [
+      {
+        "on_script": "script.heater_on",
+        "off_script": "script.heater_off",
+        "device_type": "heat",
+        "participation": "always_on"
+      }
+    ]
+    """
+    first = parse_dumb_devices_json(payload)
+    first[0]["category"] = 3
+    second = parse_dumb_devices_json(payload)
+    assert second[0]["category"] == 2
+    assert second[0] is not first[0]
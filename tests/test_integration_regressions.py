@@ -13,6 +13,7 @@ SELECT_PLATFORM = ROOT / "custom_components" / "smart_climate" / "platforms" / "
 SENSOR_PLATFORM = ROOT / "custom_components" / "smart_climate" / "platforms" / "sensor.py"
 SWITCH_PLATFORM = ROOT / "custom_components" / "smart_climate" / "platforms" / "switch.py"
 COORDINATOR = ROOT / "custom_components" / "smart_climate" / "coordinator.py"
+INTEGRATION_INIT = ROOT / "custom_components" / "smart_climate" / "__init__.py"
 
 
 def _class_def(module: ast.Module, class_name: str) -> ast.ClassDef:
@@ -122,3 +123,10 @@ def test_opposite_mode_turn_off_skips_devices_present_in_both_modes() -> None:
     assert "async def _async_deactivate_non_active_entities" in source
     assert "all_room_climates - active_current_climates - set(room.shared_climates)" in source
     assert "if dumb.on_script in active_current_dumb_on" in source
+
+
+def test_setup_and_unload_share_module_platforms() -> None:
+    source = INTEGRATION_INIT.read_text(encoding="utf-8")
+    assert "async_forward_entry_setups(entry, PLATFORMS)" in source
+    assert "async_unload_platforms(entry, PLATFORMS)" in source
+    assert "import Platform" not in source